@@ -29,13 +29,13 @@ def listar_contas_agua(
     with get_database_session() as sessao_banco:
         repositorio = ContaAguaRepository(sessao_banco)
         servico_consulta = ContaAguaQuery(repositorio=repositorio)
-        entidades = servico_consulta.listar(
+        linhas = servico_consulta.listar_linhas(
             offset=deslocamento,
             limit=limite,
             include_deleted=incluir_deletadas,
             order_desc=ordem_descendente,
         )
-        return [ContaAguaOut.from_entity(entidade) for entidade in entidades]
+        return [ContaAguaOut.from_row(linha) for linha in linhas]
 
 @router.post("/pdfs", response_model=Response)
 def importacoes_por_arquivos(files: List[UploadFile] = File(...)) -> Response:
@@ -115,13 +115,13 @@ def listar_contas_luz(
             ContaLuzRepositoryPort, ContaLuzRepository(sessao_banco)
         )
         servico_consulta = ContaLuzQueryService(repositorio=repositorio)
-        entidades = servico_consulta.listar(
+        linhas = servico_consulta.listar_linhas(
             offset=deslocamento,
             limit=limite,
             include_deleted=incluir_deletadas,
             order_desc=ordem_descendente,
         )
-        return [ContaLuzOut.from_entity(entidade) for entidade in entidades]
+        return [ContaLuzOut.from_row(linha) for linha in linhas]
 
 
 @router.post("/importacoes", response_model=SyncResult)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 import uuid
-from typing import Protocol, Iterable
+from typing import Any, Protocol, Iterable
 from core.entities.expenses.conta_agua import ContaAgua
 class ContaAguaRepositoryPort(Protocol):
     """Contrato de persistência para operações de ContaAgua (DI)."""
     def get_conta_agua(self, conta_agua_id: uuid.UUID) -> ContaAgua | None: ...
-    def list_existing_references(self) -> set[str]: ...
+    def list_existing_references(self) -> frozenset[str]: ...
     def add_many(self, contas: Iterable[ContaAgua]) -> int: ...
     def list(
         self,
@@ -15,4 +15,14 @@ class ContaAguaRepositoryPort(Protocol):
         include_deleted: bool = False,
         order_desc: bool = True,
     ) -> list[ContaAgua]: ...
+    def list_rows(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        include_deleted: bool = False,
+        order_desc: bool = True,
+    ) -> list[Any]: ...
     def put(self, conta: ContaAgua) -> ContaAgua: ...
+    def put_many(self, contas: Iterable[ContaAgua]) -> int: ...
+    def soft_delete(self, conta_agua_id: uuid.UUID) -> bool: ...
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Any
 from core.entities.expenses.conta_agua import ContaAgua
 from application.conta_agua.irepository import ContaAguaRepositoryPort
 @dataclass(slots=True)
@@ -18,3 +19,18 @@ class ContaAguaQuery:
             include_deleted=include_deleted,
             order_desc=order_desc,
         )
+    def listar_linhas(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        include_deleted: bool = False,
+        order_desc: bool = True,
+    ) -> list[Any]:
+        """Listagem só para leitura: linhas (referencia, valor), sem entidades."""
+        return self.repositorio.list_rows(
+            offset=offset,
+            limit=limit,
+            include_deleted=include_deleted,
+            order_desc=order_desc,
+        )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from typing import Any
 
 from application.shared.response import Response
 from core.entities.expenses.conta_agua import ContaAgua
@@ -14,6 +15,11 @@ class ContaAguaOut(Response):
     def from_entity(cls, entidade: ContaAgua) -> "ContaAguaOut":
         return cls(referencia=entidade.referencia, valor=entidade.valor)
 
+    @classmethod
+    def from_row(cls, linha: Any) -> "ContaAguaOut":
+        """Monta a partir de uma linha (referencia, valor) de `list_rows`."""
+        return cls(referencia=linha.referencia, valor=linha.valor)
+
     @classmethod
     def response_importacao(
         cls,
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from typing import Protocol, Iterable
+import uuid
+from typing import Any, Protocol, Iterable
 from core.entities.expenses.conta_luz import ContaLuz
 
 
 class ContaLuzRepositoryPort(Protocol):
     """Contrato de persistência para operações de ContaLuz (DI)."""
 
-    def list_existing_references(self) -> set[str]: ...
+    def list_existing_references(self) -> frozenset[str]: ...
 
     def add_many(self, contas: Iterable[ContaLuz]) -> int: ...
 
@@ -20,4 +21,17 @@ class ContaLuzRepositoryPort(Protocol):
         order_desc: bool = True,
     ) -> list[ContaLuz]: ...
 
+    def list_rows(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        include_deleted: bool = False,
+        order_desc: bool = True,
+    ) -> list[Any]: ...
+
     def put(self, conta: ContaLuz) -> ContaLuz: ...
+
+    def put_many(self, contas: Iterable[ContaLuz]) -> int: ...
+
+    def soft_delete(self, conta_luz_id: uuid.UUID) -> bool: ...
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from typing import Any
 from pydantic import BaseModel
 
 from application.shared.response import Response
@@ -15,6 +16,11 @@ class ContaLuzOut(BaseModel):
     def from_entity(cls, entidade: ContaLuz) -> "ContaLuzOut":
         return cls(referencia=entidade.referencia, valor=entidade.valor)
 
+    @classmethod
+    def from_row(cls, linha: Any) -> "ContaLuzOut":
+        """Monta a partir de uma linha (referencia, valor) de `list_rows`."""
+        return cls(referencia=linha.referencia, valor=linha.valor)
+
     @classmethod
     def sucesso_de_entidade(
         cls,
@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 import unicodedata
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Iterable, List, Optional, Tuple, Protocol
 import logging
 
@@ -10,6 +11,14 @@ import pandas as pd
 from .dataframe_wrapper import DataFrameWrapper
 from core.entities import ContaLuz
 
+# Padrões compilados uma única vez (reutilizados por todas as extrações)
+_RE_COLUNA_COMPOSTA = re.compile(
+    r"^(?P<Data>\d{2}/\d{2}/\d{4})\s+(?P<Documento>\d{4,}-\d+)\s+(?P<N1>\d+)\s+(?P<N2>\d+)$"
+)
+_RE_ESPACOS = re.compile(r"\s+")
+_RE_NAO_LETRAS = re.compile(r"[^a-z]")
+_RE_DATA_COMPLETA = re.compile(r"\b\d{2}/(\d{2})/(\d{4})\b")
+
 
 # Porta para inversão de dependência (SOLID - DIP)
 class TabelaPdfExtratora(Protocol):
@@ -155,7 +164,7 @@ class CelescExtrator:
             self._encontrar_coluna_composta(dados)
         )
         bloco_esquerda = self._decompor_coluna_composta_em_campos(
-            coluna_composta_normalizada
+            coluna_composta_normalizada, ja_normalizada=True
         )
 
         # Preservar demais colunas não consumidas
@@ -180,6 +189,8 @@ class CelescExtrator:
     # --- Utilitários internos --------------------------------------------
     @staticmethod
     def _sem_acentos_minusculo(texto: str) -> str:
+        if texto.isascii():
+            return texto.lower()
         texto_normalizado = unicodedata.normalize("NFKD", texto)
         texto_sem_acentos = "".join(
             ch for ch in texto_normalizado if not unicodedata.combining(ch)
@@ -217,28 +228,27 @@ class CelescExtrator:
     ) -> pd.DataFrame:
         return df.iloc[indice_inicio:].reset_index(drop=True).copy()
 
+    @staticmethod
+    def _normalizar_espacos(coluna: pd.Series) -> pd.Series:
+        return coluna.astype(str).str.replace(_RE_ESPACOS, " ", regex=True).str.strip()
+
     def _encontrar_coluna_composta(
         self, dados: pd.DataFrame
     ) -> Tuple[pd.Series, List[int]]:
-        padrao_coluna_composta = re.compile(
-            r"^(?P<Data>\d{2}/\d{2}/\d{4})\s+(?P<Documento>\d{4,}-\d+)\s+(?P<N1>\d+)\s+(?P<N2>\d+)$"
-        )
-
-        def pontuacao_coluna(coluna: pd.Series) -> int:
-            texto_normalizado = (
-                coluna.astype(str).str.replace(r"\s+", " ", regex=True).str.strip()
-            )
-            mascara_casamento = texto_normalizado.str.match(padrao_coluna_composta)
-            return int(mascara_casamento.fillna(False).sum())
+        # Cada candidata é normalizada uma única vez; a série vencedora já sai pronta
+        def pontuacao_coluna(coluna: pd.Series) -> Tuple[pd.Series, int]:
+            texto_normalizado = self._normalizar_espacos(coluna)
+            mascara_casamento = texto_normalizado.str.match(_RE_COLUNA_COMPOSTA)
+            return texto_normalizado, int(mascara_casamento.fillna(False).sum())
 
         quantidade_colunas = dados.shape[1]
-        candidatas: list[Tuple[pd.Series, List[int], int]] = []
+        candidatas: list[Tuple[pd.Series, int, List[int]]] = []
 
         # Testa colunas individuais
         for indice_coluna in range(quantidade_colunas):
             serie_coluna = dados.iloc[:, indice_coluna]
             candidatas.append(
-                (serie_coluna, [indice_coluna], pontuacao_coluna(serie_coluna))
+                (*pontuacao_coluna(serie_coluna), [indice_coluna])
             )
 
         # Testa combinações col0+col1, col0+col1+col2 (mais comuns)
@@ -246,7 +256,7 @@ class CelescExtrator:
             concat_01 = (
                 dados.iloc[:, 0].astype(str) + " " + dados.iloc[:, 1].astype(str)
             )
-            candidatas.append((concat_01, [0, 1], pontuacao_coluna(concat_01)))
+            candidatas.append((*pontuacao_coluna(concat_01), [0, 1]))
         if quantidade_colunas >= 3:
             concat_012 = (
                 dados.iloc[:, 0].astype(str)
@@ -255,33 +265,24 @@ class CelescExtrator:
                 + " "
                 + dados.iloc[:, 2].astype(str)
             )
-            candidatas.append((concat_012, [0, 1, 2], pontuacao_coluna(concat_012)))
+            candidatas.append((*pontuacao_coluna(concat_012), [0, 1, 2]))
 
         # Escolhe a de maior score; em empate, preferir a que consome menos colunas
-        candidatas.sort(key=lambda tpl: (tpl[2], -len(tpl[1])), reverse=True)
-        melhor_candidata = candidatas[0]
-
-        # Normaliza a série escolhida
-        serie_escolhida_normalizada = (
-            melhor_candidata[0]
-            .astype(str)
-            .str.replace(r"\s+", " ", regex=True)
-            .str.strip()
-        )
-        return serie_escolhida_normalizada, melhor_candidata[1]
+        candidatas.sort(key=lambda tpl: (tpl[1], -len(tpl[2])), reverse=True)
+        serie_escolhida_normalizada, _, indices_consumidos = candidatas[0]
+        return serie_escolhida_normalizada, indices_consumidos
 
     @staticmethod
-    def _decompor_coluna_composta_em_campos(coluna: pd.Series) -> pd.DataFrame:
+    def _decompor_coluna_composta_em_campos(
+        coluna: pd.Series, *, ja_normalizada: bool = False
+    ) -> pd.DataFrame:
         texto_normalizado = (
-            coluna.astype(str).str.replace(r"\s+", " ", regex=True).str.strip()
-        )
-        padrao_coluna_composta = re.compile(
-            r"^(?P<Data>\d{2}/\d{2}/\d{4})\s+(?P<Documento>\d{4,}-\d+)\s+(?P<N1>\d+)\s+(?P<N2>\d+)$"
+            coluna if ja_normalizada else CelescExtrator._normalizar_espacos(coluna)
         )
-        extraido = texto_normalizado.str.extract(padrao_coluna_composta)
+        extraido = texto_normalizado.str.extract(_RE_COLUNA_COMPOSTA)
 
         if extraido.isna().all(axis=None):
-            partes = texto_normalizado.str.split(r"\s+", n=3, expand=True)
+            partes = texto_normalizado.str.split(_RE_ESPACOS, n=3, expand=True)
             partes.columns = ["Data", "Documento", "N1N2_1", "N1N2_2"]
             partes["N1"] = partes["N1N2_1"].fillna("")
             partes["N2"] = partes["N1N2_2"].fillna("")
@@ -305,7 +306,7 @@ class CelescExtrator:
             nome_original = str(coluna)
             nome_normalizado = self._sem_acentos_minusculo(nome_original)
             # remove tudo que não é letra para comparação exata
-            chave_comparacao = re.sub(r"[^a-z]", "", nome_normalizado)
+            chave_comparacao = _RE_NAO_LETRAS.sub("", nome_normalizado)
             if chave_comparacao == "referencia" and nome_original != "Referência":
                 mapa_renomeio[coluna] = "Referência"
             elif chave_comparacao == "vencimento" and nome_original != "Vencimento":
@@ -345,16 +346,9 @@ class CelescExtrator:
         if "Data" not in df.columns:
             return df
         out = df.copy()
-        # Extrai mm/yyyy de dd/mm/yyyy
-        serie_data = out["Data"].astype(str)
-
-        def _to_ref(v: str) -> str:
-            m = re.search(r"\b(\d{2})/(\d{2})/(\d{4})\b", v)
-            if not m:
-                return ""
-            return f"{m.group(2)}/{m.group(3)}"
-
-        out["Referência"] = serie_data.map(_to_ref)
+        # Extrai mm/yyyy de dd/mm/yyyy numa única passada vetorizada
+        partes = out["Data"].astype(str).str.extract(_RE_DATA_COMPLETA)
+        out["Referência"] = (partes[0] + "/" + partes[1]).fillna("")
         return out
 
     # ----------------- Mapeamento para entidades de domínio -----------------
@@ -441,8 +435,6 @@ def run_extraction(
             print(df.head(5))
 
     if out_csv:
-        from pathlib import Path
-
         caminho_saida = Path(out_csv)
         caminho_saida.parent.mkdir(parents=True, exist_ok=True)
         df.to_csv(caminho_saida, index=False, encoding="utf-8")
@@ -452,8 +444,6 @@ def run_extraction(
 
 
 if __name__ == "__main__":
-    from pathlib import Path
-
     # Diretório com todas as faturas (sempre relativo a este arquivo)
     base_dir = Path(__file__).resolve().parent  # core/dataframe-wrapper
     assets_dir = base_dir.parent / "assets"  # core/assets
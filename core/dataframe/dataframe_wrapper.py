@@ -1,10 +1,16 @@
 import os
+import sys
+import numpy as np
 import pandas as pd
 import tabula
 import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, List, Optional
 
+# Textos das linhas em buffer Arrow contíguo: str.contains roda no kernel do Arrow
+_DTYPE_TEXTO = pd.StringDtype("pyarrow")
+
 
 @dataclass
 class DataFrameWrapper:
@@ -74,25 +80,53 @@ class DataFrameWrapper:
         lista_palavras = list(palavras_chave)
         if normalizar:
             lista_palavras = [
-                self._sem_acentos_minusculo(palavra) for palavra in lista_palavras
+                _palavra_chave_normalizada(palavra) for palavra in lista_palavras
             ]
 
         for tabela in tabelas:
-            for _, linha in tabela.iterrows():
-                linha_texto = " ".join(linha.astype(str))
-                if normalizar:
-                    linha_texto = self._sem_acentos_minusculo(linha_texto)
-                condicao_atendida = (
-                    all(palavra in linha_texto for palavra in lista_palavras)
-                    if exigir_todas
-                    else any(palavra in linha_texto for palavra in lista_palavras)
-                )
-                if condicao_atendida:
-                    return tabela
+            textos_linhas = self._textos_das_linhas(tabela, normalizar)
+            mascara = pd.Series(exigir_todas, index=textos_linhas.index)
+            for palavra in lista_palavras:
+                contem = textos_linhas.str.contains(palavra, regex=False)
+                mascara = (mascara & contem) if exigir_todas else (mascara | contem)
+                # Resultado já decidido: sem linhas restantes (todas) ou já casou (qualquer)
+                if mascara.any() != exigir_todas:
+                    break
+            if mascara.any():
+                return tabela
         return None
 
+    def _textos_das_linhas(self, tabela: pd.DataFrame, normalizar: bool) -> pd.Series:
+        """Texto de cada linha (células unidas por espaço), opcionalmente normalizado.
+
+        Tabelas só com colunas ``object`` (saída típica do tabula) são convertidas
+        célula a célula e normalizadas apenas sobre os valores distintos; as demais
+        seguem por ``iterrows`` para preservar a conversão de tipos por linha.
+        """
+        if all(dtype == object for dtype in tabela.dtypes):
+            celulas = tabela.astype(str).to_numpy()
+            if normalizar:
+                celulas = self._normalizar_unicos(celulas)
+            linhas = [" ".join(celulas_linha) for celulas_linha in celulas]
+        else:
+            linhas = [" ".join(linha.astype(str)) for _, linha in tabela.iterrows()]
+            if normalizar:
+                linhas = self._normalizar_unicos(np.array(linhas, dtype=object))
+        return pd.Series(linhas, dtype=_DTYPE_TEXTO)
+
+    def _normalizar_unicos(self, valores: np.ndarray) -> np.ndarray:
+        """Normaliza cada valor distinto uma única vez e reexpande para o formato original."""
+        codigos, distintos = pd.factorize(valores.ravel())
+        normalizados = np.array(
+            [self._sem_acentos_minusculo(valor) for valor in distintos], dtype=object
+        )
+        return normalizados[codigos].reshape(valores.shape)
+
     @staticmethod
     def _sem_acentos_minusculo(texto: str) -> str:
+        # ASCII puro não tem acentos: NFKD seria um no-op
+        if texto.isascii():
+            return texto.lower()
         texto_normalizado = unicodedata.normalize("NFKD", texto)
         texto_sem_acentos = "".join(
             caractere
@@ -102,6 +136,12 @@ class DataFrameWrapper:
         return texto_sem_acentos.lower()
 
 
+@lru_cache(maxsize=1024)
+def _palavra_chave_normalizada(palavra: str) -> str:
+    """Cache das palavras-chave normalizadas: repetem-se entre extrações."""
+    return sys.intern(DataFrameWrapper._sem_acentos_minusculo(palavra))
+
+
 if __name__ == "__main__":
 
     def samae():
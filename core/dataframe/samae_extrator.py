@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import os
 import re
-from dataclasses import dataclass
+import unicodedata
 from typing import Optional, Iterable, List, Protocol, cast
 from collections.abc import Hashable
+import numpy as np
 import pandas as pd
 from .dataframe_wrapper import DataFrameWrapper
 
@@ -28,11 +29,44 @@ PALAVRAS_CHAVE_HISTORICO_CONSUMO = ("HISTÓRICO", "CONSUMO", "VALOR")
 PADRAO_MOEDA = r"\d{1,3}(?:\.\d{3})*,\d{2}"
 PADRAO_REFERENCIA_MM_YYYY = r"(\b\d{2}/\d{4}\b)"
 
+# Regex compiladas uma única vez (evita lookup no cache do `re` a cada chamada)
+_RE_MOEDA = re.compile(PADRAO_MOEDA)
+_RE_REF_MM_YYYY = re.compile(PADRAO_REFERENCIA_MM_YYYY)
+# Mesma referência com mês e ano em grupos próprios (dispensa o split por linha)
+_RE_REF_MM_YYYY_PARTES = re.compile(r"\b(\d{2})/(\d{4})\b")
+_RE_NAO_ALFANUMERICO = re.compile(r"[^a-z0-9]")
+
+# Tabela de tradução para acentos comuns do português (Latin-1) -> ASCII.
+# Cobre a quase totalidade dos textos das faturas sem passar pela decomposição NFKD.
+_ACCENT_TABLE = str.maketrans(
+    "áàâãäéèêëíìîïóòôõöúùûüçñÁÀÂÃÄÉÈÊËÍÌÎÏÓÒÔÕÖÚÙÛÜÇÑ",
+    "aaaaaeeeeiiiiooooouuuucnAAAAAEEEEIIIIOOOOOUUUUCN",
+)
+
+
+def _remover_acentos_nfkd(texto: str) -> str:
+    """Caminho lento: decomposição NFKD para caracteres fora da tabela de tradução."""
+    texto_norm = unicodedata.normalize("NFKD", texto)
+    return "".join(
+        caractere for caractere in texto_norm if not unicodedata.combining(caractere)
+    )
+
+
+def _normalizar_texto(texto: str) -> str:
+    """Remove acentos e converte para minúsculas, usando NFKD apenas quando necessário."""
+    if texto.isascii():
+        return texto.lower()
+    texto_traduzido = texto.translate(_ACCENT_TABLE).lower()
+    if texto_traduzido.isascii():
+        return texto_traduzido
+    return _remover_acentos_nfkd(texto_traduzido)
+
 
-@dataclass(init=False)
 class SamaeExtrator:
     """Extrai a linha atual de faturas SAMAE e retorna Referência e Valor (R$)."""
 
+    __slots__ = ("_caminho_pdf", "wrapper", "tabela")
+
     wrapper: TabelaPdfExtratora
     tabela: pd.DataFrame
 
@@ -78,7 +112,9 @@ class SamaeExtrator:
 
     # --- Passos do domínio -------------------------------------------------
     def _montar_linha_atual(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.dropna(axis=1, how="all").reset_index(drop=True)
+        # Mantém só colunas com algum valor; seleção por rótulos/posição dispensa reset_index
+        colunas_com_valor = df.notna().any(axis=0)
+        df = df.loc[:, colunas_com_valor]
 
         valor_col_opt = self._detectar_coluna_valor(df)
         if valor_col_opt is None:
@@ -95,19 +131,23 @@ class SamaeExtrator:
     # --- Heurísticas/coadjuvantes -----------------------------------------
     def _detectar_coluna_valor(self, df: pd.DataFrame) -> Optional[Hashable]:
         """Tenta encontrar a coluna de valor pelo cabeçalho e, em fallback, pelo conteúdo."""
-        for coluna_rotulo in df.columns:
-            rotulo_normalizado = self._chave_normalizada(str(coluna_rotulo))
-            if rotulo_normalizado in ("valorrs", "valorr", "valor") or (
-                "valor" in rotulo_normalizado
-                and ("rs" in rotulo_normalizado or "r" in rotulo_normalizado)
-            ):
+        # "valorrs"/"valorr"/"valor (r$)" contêm "valor": um único teste de substring basta.
+        # O gerador normaliza rótulo a rótulo e para no primeiro acerto.
+        rotulos_normalizados = (
+            (self._chave_normalizada(str(coluna_rotulo)), coluna_rotulo)
+            for coluna_rotulo in df.columns
+        )
+        for rotulo_normalizado, coluna_rotulo in rotulos_normalizados:
+            if "valor" in rotulo_normalizado:
                 return coluna_rotulo
-        # Conteúdo da última coluna como fallback
+
+        # Conteúdo da última coluna como fallback (só avaliado sem acerto no cabeçalho)
+        if len(df.columns) == 0:
+            return None
         ultima_coluna: Hashable = cast(Hashable, df.columns[-1])
         proporcao_padrao_moeda = (
-            df[ultima_coluna]
-            .astype(str)
-            .str.contains(PADRAO_MOEDA, regex=True, na=False)
+            self._como_texto(df[ultima_coluna])
+            .str.contains(_RE_MOEDA, regex=True, na=False)
             .mean()
         )
         if proporcao_padrao_moeda > 0.3:
@@ -116,28 +156,32 @@ class SamaeExtrator:
 
     def _selecionar_linha_atual(self, df: pd.DataFrame) -> pd.Series:
         """Seleciona a linha marcada como (Atual) ou, em falta, a mais recente por mm/yyyy."""
-        primeira_coluna: Hashable = cast(Hashable, df.columns[0])
-        primeira_serie: pd.Series = df[primeira_coluna].astype(str).fillna("")
-
-        # Filtra explícito "(Atual)"
-        texto_normalizado: pd.Series = self._sem_acentos_minusculo(primeira_serie)
-        mascara_atual = texto_normalizado.str.contains(r"\(atual\)", na=False)
-        linhas_candidatas = df[mascara_atual]
-        if not linhas_candidatas.empty:
-            return linhas_candidatas.iloc[0]
-
-        # Senão, escolhe por maior mm/yyyy
-        serie_mm_yyyy = primeira_serie.apply(self._extrair_mm_yyyy)
-        # Converte para ordenação YYYYMM
-        ordem_yyyymm = serie_mm_yyyy.apply(self._yyyy_mm_int)
-        if ordem_yyyymm.isna().all():
+        # Períodos se repetem entre páginas: cada texto distinto da primeira coluna é
+        # normalizado e casado uma única vez; os códigos reexpandem o resultado por linha.
+        codigos, distintos = pd.factorize(df.iloc[:, 0].astype(str).to_numpy())
+        atual_por_texto = np.zeros(len(distintos), dtype=bool)
+        yyyymm_por_texto = np.full(len(distintos), -1, dtype=np.int64)
+        for indice, texto in enumerate(distintos):
+            if "(atual)" in _normalizar_texto(texto):
+                atual_por_texto[indice] = True
+                continue
+            match = _RE_REF_MM_YYYY_PARTES.search(texto)
+            if match:
+                mes, ano = match.groups()
+                yyyymm_por_texto[indice] = int(ano) * 100 + int(mes)
+
+        linhas_atuais = atual_por_texto[codigos]
+        if linhas_atuais.any():
+            return df.iloc[int(linhas_atuais.argmax())]
+        yyyymm_por_linha = yyyymm_por_texto[codigos]
+        if not len(yyyymm_por_linha) or yyyymm_por_linha.max() < 0:
             raise ValueError("Não foi possível determinar a referência atual.")
-        indice_maximo = ordem_yyyymm.idxmax()
-        return df.loc[indice_maximo]
+        # argmax devolve a primeira ocorrência do maior período, como no laço anterior
+        return df.iloc[int(yyyymm_por_linha.argmax())]
 
     def _extrair_referencia(self, linha: pd.Series) -> str:
         texto_celula_inicial = str(linha.iloc[0])
-        match = re.search(PADRAO_REFERENCIA_MM_YYYY, texto_celula_inicial)
+        match = _RE_REF_MM_YYYY.search(texto_celula_inicial)
         if not match:
             raise ValueError("Referência (mm/yyyy) não identificada na linha atual.")
         return f"{match.group(1)} (Atual)"
@@ -145,56 +189,27 @@ class SamaeExtrator:
     def _extrair_valor(self, linha: pd.Series, valor_col: Hashable) -> str:
         valor_str = str(linha[valor_col]).strip()
         if not valor_str or valor_str.lower() == "nan":
-            linha_texto = " ".join(linha.astype(str).tolist())
-            match_valor = re.search(PADRAO_MOEDA, linha_texto)
-            if not match_valor:
-                raise ValueError("Valor atual não identificado.")
-            valor_str = match_valor.group(0)
+            # Procura célula a célula, sem materializar a linha inteira como texto
+            for celula in linha.values:
+                match_valor = _RE_MOEDA.search(str(celula))
+                if match_valor:
+                    return match_valor.group(0)
+            raise ValueError("Valor atual não identificado.")
         return valor_str
 
     @staticmethod
-    def _extrair_mm_yyyy(texto: str) -> Optional[str]:
-        if not texto:
-            return None
-        match = re.search(PADRAO_REFERENCIA_MM_YYYY, texto)
-        return match.group(1) if match else None
-
-    @staticmethod
-    def _yyyy_mm_int(mm_yyyy: Optional[str]) -> Optional[int]:
-        if not mm_yyyy:
-            return None
-        try:
-            mm, yyyy = mm_yyyy.split("/")
-            return int(yyyy) * 100 + int(mm)
-        except Exception:
-            return None
-
-    @staticmethod
-    def _sem_acentos_minusculo(serie: pd.Series) -> pd.Series:
-        import unicodedata as _unicodedata
-
-        def normalizar_texto(texto: str) -> str:
-            texto_norm = _unicodedata.normalize("NFKD", texto)
-            texto_sem_acentos = "".join(
-                caractere
-                for caractere in texto_norm
-                if not _unicodedata.combining(caractere)
-            )
-            return texto_sem_acentos.lower()
-
-        return serie.astype(str).fillna("").map(normalizar_texto)
+    def _como_texto(serie: pd.Series) -> pd.Series:
+        """Converte para texto só quando necessário: a saída do tabula já é object/str."""
+        if serie.dtype == object:
+            return serie
+        return serie.astype(str)
 
     @staticmethod
     def _chave_normalizada(texto: str) -> str:
-        import unicodedata as _unicodedata
-
-        texto_norm = _unicodedata.normalize("NFKD", texto)
-        texto_sem_acentos = "".join(
-            caractere
-            for caractere in texto_norm
-            if not _unicodedata.combining(caractere)
-        ).lower()
-        return re.sub(r"[^a-z0-9]", "", texto_sem_acentos)
+        if texto.isascii():
+            return _RE_NAO_ALFANUMERICO.sub("", texto.lower())
+        texto_sem_acentos = _normalizar_texto(texto)
+        return _RE_NAO_ALFANUMERICO.sub("", texto_sem_acentos)
 
 
 def obter_tabela_samae(caminho_pdf: str) -> pd.DataFrame:
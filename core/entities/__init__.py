@@ -3,8 +3,4 @@ from core.entities.transaction import Transaction
 from core.entities.expenses.conta_luz import ContaLuz
 from core.entities.expenses.conta_agua import ContaAgua
 
-__all__ = [Expense, Transaction]
-
-
-
-
+__all__ = ["Expense", "Transaction", "ContaLuz", "ContaAgua"]
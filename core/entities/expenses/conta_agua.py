@@ -1,11 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from datetime import datetime, timezone, date
+from datetime import datetime, date
 from decimal import Decimal
 from typing import Optional, Union
 
 from core.shared.entities import Entity
-from core.shared.value_objects import ReferenciaMensal
+from core.shared.entities.entity import _now_utc
 from core.value_object.mes_referencia import MesReferencia
 from core.value_object.valor import Valor
 
@@ -32,6 +32,22 @@ class ContaAgua(Entity):
     def referencia(self) -> str:
         return f"{self.referencia_data.month:02d}/{self.referencia_data.year}"
 
+    # ----------------- Coerções -----------------
+    @staticmethod
+    def _coerce_mes_referencia(
+        mes_referencia: Union[str, date, datetime, MesReferencia],
+    ) -> MesReferencia:
+        if isinstance(mes_referencia, MesReferencia):
+            return mes_referencia
+        if isinstance(mes_referencia, (date, datetime)):
+            return MesReferencia.criar_de_data(mes_referencia)
+        if isinstance(mes_referencia, str):
+            return MesReferencia.criar_de_texto(mes_referencia)
+        raise TypeError(
+            "mes_referencia deve ser str, date, datetime ou MesReferencia, "
+            f"não {type(mes_referencia).__name__}."
+        )
+
     # ----------------- Fábricas de criação -----------------
     @classmethod
     def criar(
@@ -39,13 +55,7 @@ class ContaAgua(Entity):
         mes_referencia: Union[str, date, datetime, MesReferencia],
         valor: Union[str, int, float, Decimal, Valor],
     ) -> "ContaAgua":
-        if isinstance(mes_referencia, MesReferencia):
-            ref_vo = mes_referencia
-        elif isinstance(mes_referencia, (date, datetime)):
-            ref_vo = MesReferencia.criar_de_data(mes_referencia)
-        else:
-            ref_vo = MesReferencia.criar_de_texto(str(mes_referencia))
-
+        ref_vo = cls._coerce_mes_referencia(mes_referencia)
         val_vo = valor if isinstance(valor, Valor) else Valor.criar_de_bruto(valor)
         return cls(referencia_data=ref_vo.para_banco(), valor=val_vo.valor)
 
@@ -57,19 +67,14 @@ class ContaAgua(Entity):
         valor: Optional[Union[str, int, float, Decimal, Valor]] = None,
     ) -> "ContaAgua":
         if mes_referencia is not None:
-            if isinstance(mes_referencia, MesReferencia):
-                ref_vo = mes_referencia
-            elif isinstance(mes_referencia, (date, datetime)):
-                ref_vo = MesReferencia.criar_de_data(mes_referencia)
-            else:
-                ref_vo = MesReferencia.criar_de_texto(str(mes_referencia))
+            ref_vo = self._coerce_mes_referencia(mes_referencia)
             self.referencia_data = ref_vo.para_banco()
 
         if valor is not None:
             val_vo = valor if isinstance(valor, Valor) else Valor.criar_de_bruto(valor)
             self.valor = val_vo.valor
 
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _now_utc()
         return self
 
     def delete(self) -> None:
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Optional, Union
 
 from core.shared.entities import Entity
+from core.shared.entities.entity import _now_utc
 from core.shared.value_objects import ReferenciaMensal, ValorMonetario
 
 
@@ -25,7 +25,7 @@ class ContaLuz(Entity):
     def criar(
         cls, mes_referencia: str, valor: Union[str, int, float, Decimal]
     ) -> "ContaLuz":
-        ref_vo = ReferenciaMensal(mes_referencia)
+        ref_vo = ReferenciaMensal.de_texto(mes_referencia)
         val_vo = ValorMonetario.from_bruto(valor)
         return cls(referencia=ref_vo.referencia, valor=val_vo.valor)
 
@@ -34,7 +34,7 @@ class ContaLuz(Entity):
         cls, mes_referencia: str, valor_em_centavos: int
     ) -> "ContaLuz":
         """Cria a entidade a partir de um inteiro em centavos (persistência SQLite recomendada: INTEGER)."""
-        ref_vo = ReferenciaMensal(mes_referencia)
+        ref_vo = ReferenciaMensal.de_texto(mes_referencia)
         val_vo = ValorMonetario.from_centavos(valor_em_centavos)
         return cls(referencia=ref_vo.referencia, valor=val_vo.valor)
 
@@ -46,16 +46,16 @@ class ContaLuz(Entity):
         valor: Optional[Union[str, int, float, Decimal]] = None,
     ) -> "ContaLuz":
         if mes_referencia is not None:
-            self.referencia = ReferenciaMensal(mes_referencia).referencia
+            self.referencia = ReferenciaMensal.de_texto(mes_referencia).referencia
         if valor is not None:
             self.valor = ValorMonetario.from_bruto(valor).valor
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _now_utc()
         return self
 
     def atualizar_por_centavos(self, valor_em_centavos: int) -> "ContaLuz":
         """Atualiza o valor a partir de um inteiro em centavos (para escrita vinda do banco)."""
         self.valor = ValorMonetario.from_centavos(valor_em_centavos).valor
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _now_utc()
         return self
 
     def delete(self) -> None:
@@ -3,14 +3,105 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Iterable, Optional, Union
 from uuid import UUID
 
+import numpy as np
+import pandas as pd
+
 from core.entities.expense import Expense
+from core.shared.entities.entity import _now_utc, _uuid7_batch
 from core.value_object import Description, MonetaryValue, ExpenseType, EventDate
 from core.entities.expenses.expense_variable_type import ExpenseVariableType
 
 
+# Sentinel to distinguish "not provided" from an explicit None in patch
+_NOT_PROVIDED: object = object()
+
+
+# VOs are immutable, so repeated raw inputs (e.g. bulk imports) can share one instance.
+@lru_cache(maxsize=1024)
+def _event_date_from_text(value: str) -> EventDate:
+    return EventDate.criar_de_texto(value)
+
+
+# ExpenseType factories already return cached flyweights; text may be a code or a name.
+def _expense_type_from_raw(value: Union[int, str]) -> ExpenseType:
+    try:
+        return ExpenseType.criar_de_codigo(value)
+    except Exception:
+        if isinstance(value, str):
+            return ExpenseType.criar_de_nome(value)
+        raise
+
+
+# ----------------- Coercion dispatch -----------------
+# Exact-type lookups resolve the common inputs with a single dict hit; the fallbacks keep
+# the isinstance semantics for subclasses and anything not listed.
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _event_date_fallback(value: Any) -> EventDate:
+    if isinstance(value, EventDate):
+        return value
+    if isinstance(value, (date, datetime)):
+        return EventDate.criar_de_data(value)
+    if isinstance(value, str):
+        return _event_date_from_text(value)
+    raise TypeError(f"event_date must be str, date, datetime or EventDate, not {type(value).__name__}.")
+
+
+def _amount_fallback(value: Any) -> MonetaryValue:
+    return value if isinstance(value, MonetaryValue) else MonetaryValue.criar_de_bruto(value)
+
+
+def _description_fallback(value: Any) -> Description:
+    return value if isinstance(value, Description) else Description.criar_de_texto(value)
+
+
+def _expense_type_fallback(value: Any) -> ExpenseType:
+    return value if isinstance(value, ExpenseType) else _expense_type_from_raw(value)
+
+
+def _type_id_fallback(value: Any) -> Optional[UUID]:
+    if isinstance(value, ExpenseVariableType):
+        return value.id
+    if isinstance(value, UUID):
+        return value
+    return None
+
+
+_EVENT_DATE_DISPATCH: dict[type, Callable[[Any], EventDate]] = {
+    EventDate: _identity,
+    date: EventDate.criar_de_data,
+    datetime: EventDate.criar_de_data,
+    str: _event_date_from_text,
+}
+_AMOUNT_DISPATCH: dict[type, Callable[[Any], MonetaryValue]] = {
+    MonetaryValue: _identity,
+    str: MonetaryValue.criar_de_bruto,
+    int: MonetaryValue.criar_de_bruto,
+    float: MonetaryValue.criar_de_bruto,
+    Decimal: MonetaryValue.criar_de_bruto,
+}
+_DESCRIPTION_DISPATCH: dict[type, Callable[[Any], Description]] = {
+    Description: _identity,
+    str: Description.criar_de_texto,
+}
+_EXPENSE_TYPE_DISPATCH: dict[type, Callable[[Any], ExpenseType]] = {
+    ExpenseType: _identity,
+    int: ExpenseType.criar_de_codigo,
+    str: _expense_type_from_raw,
+}
+_TYPE_ID_DISPATCH: dict[type, Callable[[Any], Optional[UUID]]] = {
+    ExpenseVariableType: lambda value: value.id,
+    UUID: _identity,
+    type(None): lambda _value: None,
+}
+
+
 @dataclass(slots=True, kw_only=True)
 class ExpenseVariable(Expense):
     """
@@ -26,45 +117,29 @@ class ExpenseVariable(Expense):
     event_date: EventDate
     expense_variable_type_id: Optional[UUID] = None
 
-    bill_label: str = "Expense"
-
-    _NOT_PROVIDED: object = object()
+    # Class-level label: not a dataclass field, so it takes no per-instance slot
+    bill_label: ClassVar[str] = "Expense"
 
     # ----------------- Utilities -----------------
     @staticmethod
     def _extract_type_id(value: Optional[Union[UUID, "ExpenseVariableType"]]) -> Optional[UUID]:
-        if isinstance(value, ExpenseVariableType):
-            return value.id
-        if isinstance(value, UUID):
-            return value
-        return None
+        return _TYPE_ID_DISPATCH.get(type(value), _type_id_fallback)(value)
 
     @staticmethod
     def _coerce_event_date(value: Union[str, date, datetime, EventDate]) -> EventDate:
-        if isinstance(value, EventDate):
-            return value
-        if isinstance(value, (date, datetime)):
-            return EventDate.criar_de_data(value)
-        return EventDate.criar_de_texto(str(value))
+        return _EVENT_DATE_DISPATCH.get(type(value), _event_date_fallback)(value)
 
     @staticmethod
     def _coerce_amount(value: Union[str, int, float, Decimal, MonetaryValue]) -> MonetaryValue:
-        return value if isinstance(value, MonetaryValue) else MonetaryValue.criar_de_bruto(value)
+        return _AMOUNT_DISPATCH.get(type(value), _amount_fallback)(value)
 
     @staticmethod
     def _coerce_description(value: Union[str, Description]) -> Description:
-        return value if isinstance(value, Description) else Description.criar_de_texto(value)
+        return _DESCRIPTION_DISPATCH.get(type(value), _description_fallback)(value)
 
     @staticmethod
     def _coerce_expense_type(value: Union[ExpenseType, int, str]) -> ExpenseType:
-        if isinstance(value, ExpenseType):
-            return value
-        try:
-            return ExpenseType.criar_de_codigo(value)
-        except Exception:
-            if isinstance(value, str):
-                return ExpenseType.criar_de_nome(value)
-            raise
+        return _EXPENSE_TYPE_DISPATCH.get(type(value), _expense_type_fallback)(value)
 
     # ----------------- Factory (Create) -----------------
     @classmethod
@@ -90,6 +165,79 @@ class ExpenseVariable(Expense):
             expense_variable_type_id=type_id,
         )
 
+    # ----------------- Hydration (Read from DB) -----------------
+    @classmethod
+    def _from_row(
+        cls,
+        *,
+        id: UUID,
+        description: Union[str, Description],
+        amount: Union[str, int, float, Decimal, MonetaryValue],
+        expense_type: Union[ExpenseType, int, str],
+        event_date: Union[str, date, datetime, EventDate],
+        expense_variable_type_id: Optional[UUID],
+        created_at: datetime,
+        updated_at: Optional[datetime] = None,
+        deleted_at: Optional[datetime] = None,
+    ) -> "ExpenseVariable":
+        """
+        Rebuilds a persisted expense without running __init__ or its default factories: identity and
+        audit timestamps come from the row, so no UUIDv7 or now() is generated and discarded.
+        """
+        obj = object.__new__(cls)
+        obj.id = id
+        obj.created_at = created_at
+        obj.updated_at = updated_at
+        obj.deleted_at = deleted_at
+        obj.description = cls._coerce_description(description)
+        obj.amount = cls._coerce_amount(amount)
+        obj.expense_type = cls._coerce_expense_type(expense_type)
+        obj.event_date = cls._coerce_event_date(event_date)
+        obj.expense_variable_type_id = expense_variable_type_id
+        return obj
+
+    @classmethod
+    def criar_muitos(cls, rows: pd.DataFrame) -> list["ExpenseVariable"]:
+        """
+        Bulk factory over a DataFrame with the criar() keyword names as columns
+        (description, amount, expense_type, event_date and, optionally, variable_type).
+
+        Each column is factorized once, so only its distinct raw values go through
+        VO coercion; rows then reuse those (immutable) VOs by integer code.
+        """
+        def coerce_column(column: str, coerce: Callable[[Any], Any]) -> list[Any]:
+            codes, uniques = pd.factorize(rows[column], use_na_sentinel=False)
+            coerced = [coerce(value) for value in uniques]
+            return [coerced[code] for code in codes]
+
+        descriptions = coerce_column("description", cls._coerce_description)
+        amounts = coerce_column("amount", cls._coerce_amount)
+        expense_types = coerce_column("expense_type", cls._coerce_expense_type)
+        event_dates = coerce_column("event_date", cls._coerce_event_date)
+        if "variable_type" in rows.columns:
+            type_ids = coerce_column("variable_type", cls._extract_type_id)
+        else:
+            type_ids = [None] * len(rows)
+
+        # New entities share one created_at and draw their ids from a single RNG call;
+        # _from_row then skips the per-row default factories.
+        ids = _uuid7_batch(len(rows))
+        created_at = _now_utc()
+        return [
+            cls._from_row(
+                id=entity_id,
+                description=desc_vo,
+                amount=amount_vo,
+                expense_type=type_vo,
+                event_date=date_vo,
+                expense_variable_type_id=type_id,
+                created_at=created_at,
+            )
+            for entity_id, desc_vo, amount_vo, type_vo, date_vo, type_id in zip(
+                ids, descriptions, amounts, expense_types, event_dates, type_ids
+            )
+        ]
+
     # ----------------- Full Update -----------------
     def atualizar(
         self,
@@ -118,30 +266,105 @@ class ExpenseVariable(Expense):
         event_date: Optional[Union[str, date, datetime, EventDate]] = None,
         variable_type: object = _NOT_PROVIDED,
     ) -> "ExpenseVariable":
+        # Values equal to the current ones (VOs compare by value) are no-ops, so an
+        # idempotent PATCH neither rewrites the field nor moves updated_at.
         changed = False
         if description is not None:
-            self.description = self._coerce_description(description)
-            changed = True
+            new_description = self._coerce_description(description)
+            if new_description != self.description:
+                self.description = new_description
+                changed = True
         if amount is not None:
-            self.amount = self._coerce_amount(amount)
-            changed = True
+            new_amount = self._coerce_amount(amount)
+            if new_amount != self.amount:
+                self.amount = new_amount
+                changed = True
         if expense_type is not None:
-            self.expense_type = self._coerce_expense_type(expense_type)
-            changed = True
+            new_expense_type = self._coerce_expense_type(expense_type)
+            if new_expense_type != self.expense_type:
+                self.expense_type = new_expense_type
+                changed = True
         if event_date is not None:
-            self.event_date = self._coerce_event_date(event_date)
-            changed = True
-        if variable_type is not self._NOT_PROVIDED:
-            self.expense_variable_type_id = self._extract_type_id(variable_type)  # type: ignore[arg-type]
-            changed = True
+            new_event_date = self._coerce_event_date(event_date)
+            if new_event_date != self.event_date:
+                self.event_date = new_event_date
+                changed = True
+        if variable_type is not _NOT_PROVIDED:
+            new_type_id = self._extract_type_id(variable_type)  # type: ignore[arg-type]
+            if new_type_id != self.expense_variable_type_id:
+                self.expense_variable_type_id = new_type_id
+                changed = True
         if changed:
             self.registrar_atualizacao()
         return self
 
+    @classmethod
+    def patch_amounts(
+        cls,
+        items: Iterable["ExpenseVariable"],
+        amounts: Iterable[Union[str, int, float, Decimal, MonetaryValue]],
+    ) -> list["ExpenseVariable"]:
+        """
+        Batch form of patch(amount=...) for bulk imports: old and new amounts are compared
+        as int64 cents in one vectorized pass, and only the rows that really change are
+        rewritten and stamped (all with the same updated_at). Returns the changed items.
+        """
+        items = list(items)
+        new_amounts = [cls._coerce_amount(amount) for amount in amounts]
+        if len(new_amounts) != len(items):
+            raise ValueError("items and amounts must have the same length")
+        count = len(items)
+        old_cents = np.fromiter(
+            (item.amount.to_centavos() for item in items), dtype=np.int64, count=count
+        )
+        new_cents = np.fromiter(
+            (amount.to_centavos() for amount in new_amounts), dtype=np.int64, count=count
+        )
+        changed = np.flatnonzero(old_cents != new_cents).tolist()
+        if not changed:
+            return []
+        updated_at = _now_utc()
+        for index in changed:
+            item = items[index]
+            item.amount = new_amounts[index]
+            item.registrar_atualizacao(updated_at)
+        return [items[index] for index in changed]
+
     # ----------------- Soft Delete -----------------
     def delete(self) -> None:
         self.register_deletion()
 
+    # ----------------- Bulk aggregation -----------------
+    @staticmethod
+    def to_soa(items: Iterable["ExpenseVariable"]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Struct-of-arrays view of a batch: (YYYYMM as int32, amount in cents as int64).
+        Cents keep the arithmetic exact, unlike float64 amounts.
+        """
+        items = list(items)
+        count = len(items)
+        periods = np.fromiter(
+            (item.event_date.ano * 100 + item.event_date.mes for item in items),
+            dtype=np.int32,
+            count=count,
+        )
+        cents = np.fromiter(
+            (item.amount.to_centavos() for item in items), dtype=np.int64, count=count
+        )
+        return periods, cents
+
+    @classmethod
+    def sum_by_month(cls, items: Iterable["ExpenseVariable"]) -> dict[str, Decimal]:
+        """Totals per "MM/YYYY" reference, in chronological order."""
+        periods, cents = cls.to_soa(items)
+        unique_periods, inverse = np.unique(periods, return_inverse=True)
+        totals = np.zeros(len(unique_periods), dtype=np.int64)
+        np.add.at(totals, inverse, cents)
+        return {
+            f"{period % 100:02d}/{period // 100}": Decimal(total).scaleb(-2)
+            for period, total in zip(unique_periods.tolist(), totals.tolist())
+        }
+
     # ----------------- Presentation helpers -----------------
     @property
     def reference(self) -> str:
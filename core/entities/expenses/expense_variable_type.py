@@ -1,10 +1,31 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
 from core.shared.entities import Entity
 from core.value_object import Description
 
 
+# Sentinel to distinguish not-provided from explicit None in patch
+_NOT_PROVIDED: object = object()
+
+
+# Exact-type dispatch for description coercion (same scheme as ExpenseVariable);
+# the fallback keeps isinstance semantics for subclasses and rejects anything else.
+def _description_fallback(value: Any) -> Optional[Description]:
+    if isinstance(value, Description):
+        return value
+    if isinstance(value, str):
+        return Description.criar_de_texto(value)
+    raise TypeError("description must be str, Description or None.")
+
+
+_DESCRIPTION_DISPATCH: dict[type, Callable[[Any], Optional[Description]]] = {
+    type(None): lambda _value: None,
+    Description: lambda value: value,
+    str: Description.criar_de_texto,
+}
+
+
 @dataclass(slots=True, kw_only=True)
 class ExpenseVariableType(Entity):
     """
@@ -16,18 +37,9 @@ class ExpenseVariableType(Entity):
     description: Optional[Description] = None
     is_active: bool = True
 
-    # Sentinel to distinguish not-provided from explicit None in patch
-    _NOT_PROVIDED: object = object()
-
     @staticmethod
     def _coerce_description(value: object) -> Optional[Description]:
-        if value is None:
-            return None
-        if isinstance(value, Description):
-            return value
-        if isinstance(value, str):
-            return Description.criar_de_texto(value)
-        raise TypeError("description must be str, Description or None.")
+        return _DESCRIPTION_DISPATCH.get(type(value), _description_fallback)(value)
 
     # ----------------- Factory (Create) -----------------
     @classmethod
@@ -75,7 +87,7 @@ class ExpenseVariableType(Entity):
         if name is not None:
             self.name = name
             changed = True
-        if description is not self._NOT_PROVIDED:
+        if description is not _NOT_PROVIDED:
             self.description = self._coerce_description(description)
             changed = True
         if is_active is not None:
@@ -96,12 +108,15 @@ class ExpenseVariableType(Entity):
     # ----------------- Serialization -----------------
     def to_dict(self) -> dict:
         """Converts the entity to a serializable dict (e.g., JSON)."""
+        # Each slot is read once; the dict literal itself is already the cheapest build.
+        description = self.description
+        created_at, updated_at, deleted_at = self.created_at, self.updated_at, self.deleted_at
         return {
             "id": self.id,
             "name": self.name,
-            "description": self.description.como_texto() if self.description else None,
+            "description": description.como_texto() if description is not None else None,
             "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "deleted_at": self.deleted_at.isoformat() if self.deleted_at else None,
-        }
\ No newline at end of file
+            "created_at": created_at.isoformat() if created_at is not None else None,
+            "updated_at": updated_at.isoformat() if updated_at is not None else None,
+            "deleted_at": deleted_at.isoformat() if deleted_at is not None else None,
+        }
@@ -1,10 +1,11 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Optional, Union
+from typing import Any, Callable, Iterable, Mapping, NamedTuple, Optional, Union
 from uuid import UUID
 
 from core.shared.entities import Entity
+from core.shared.entities.entity import _generate_uuid7, _now_utc
 from core.value_object import (
     Valor,
     Descricao,
@@ -12,6 +13,60 @@ from core.value_object import (
     EventoData,
 )
 
+class TransactionRow(NamedTuple):
+    """Linha de persistência de tamanho fixo (mesmos campos de `como_registro_banco`)."""
+
+    identificador: UUID
+    descricao: str
+    data_evento: date
+    valor_monetario_centavos: int
+    tipo: str
+    criado_em: datetime
+    atualizado_em: Optional[datetime]
+    deletado_em: Optional[datetime]
+
+
+# Tipo padrão: VO imutável (frozen), então uma única instância é compartilhada
+_TIPO_ENTRADA: TransactionType = TransactionType.criar_de_nome("ENTRADA")
+
+
+# ----------------- Coerções por tipo exato -----------------
+# Um único lookup no dict resolve as entradas comuns; o fallback mantém a semântica de
+# isinstance para subclasses e para o que não estiver listado.
+def _tipo_fallback(tipo: Any) -> TransactionType:
+    if isinstance(tipo, TransactionType):
+        return tipo
+    if tipo is None:
+        return _TIPO_ENTRADA
+    return TransactionType.criar_de_codigo(tipo)
+
+
+def _valor_fallback(valor: Any) -> Valor:
+    return valor if isinstance(valor, Valor) else Valor.criar_de_bruto(valor)
+
+
+_TIPO_DISPATCH: dict[type, Callable[[Any], TransactionType]] = {
+    TransactionType: lambda tipo: tipo,
+    type(None): lambda _tipo: _TIPO_ENTRADA,
+    int: TransactionType.criar_de_codigo,
+    str: TransactionType.criar_de_codigo,
+}
+_VALOR_DISPATCH: dict[type, Callable[[Any], Valor]] = {
+    Valor: lambda valor: valor,
+    str: Valor.criar_de_bruto,
+    int: Valor.criar_de_bruto,
+    float: Valor.criar_de_bruto,
+    Decimal: Valor.criar_de_bruto,
+}
+
+
+def _coagir_tipo(tipo: Optional[Union[int, str, TransactionType]]) -> TransactionType:
+    return _TIPO_DISPATCH.get(type(tipo), _tipo_fallback)(tipo)
+
+
+def _coagir_valor(valor: Union[Valor, str, int, float, Decimal]) -> Valor:
+    return _VALOR_DISPATCH.get(type(valor), _valor_fallback)(valor)
+
 
 @dataclass(slots=True, init=False)
 class Transaction(Entity):
@@ -23,9 +78,7 @@ class Transaction(Entity):
     descricao: Descricao 
     data_evento: EventoData
     valor: Valor  # Removida opcionalidade
-    tipo: TransactionType = field(
-        default_factory=lambda: TransactionType.criar_de_nome("ENTRADA")
-    )
+    tipo: TransactionType = _TIPO_ENTRADA
 
     def __init__(
         self,
@@ -39,9 +92,15 @@ class Transaction(Entity):
         self.descricao = descricao
         self.data_evento = data_evento
         self.valor = valor
-        self.tipo = tipo if isinstance(tipo, TransactionType) and tipo is not None else TransactionType.criar_de_nome("ENTRADA")
-        # Inicializa campos de auditoria/identidade
-        Entity.__post_init__(self)
+        # As fábricas já entregam o VO coagido; a checagem só existe fora de `python -O`
+        assert isinstance(tipo, TransactionType), "tipo deve ser um TransactionType"
+        self.tipo = tipo
+        # Este __init__ substitui o gerado pelo dataclass, então as defaults de Entity não
+        # rodam: identidade/auditoria são inicializadas aqui.
+        self.id = _generate_uuid7()
+        self.created_at = _now_utc()
+        self.updated_at = None
+        self.deleted_at = None
 
     # CRUD - Criar
     @classmethod
@@ -55,16 +114,8 @@ class Transaction(Entity):
         
         descricao_vo = Descricao.criar_de_texto(descricao)
         data_vo = EventoData.criar_de_texto(texto_data_evento)
-        valor_vo = valor_monetario if isinstance(valor_monetario, Valor) else Valor.criar_de_bruto(valor_monetario)
-        tipo_vo = (
-            tipo
-            if isinstance(tipo, TransactionType)
-            else (
-                TransactionType.criar_de_codigo(tipo)
-                if tipo is not None
-                else TransactionType.criar_de_nome("ENTRADA")
-            )
-        )
+        valor_vo = _coagir_valor(valor_monetario)
+        tipo_vo = _coagir_tipo(tipo)
         return cls(
             descricao=descricao_vo,
             data_evento=data_vo,
@@ -95,32 +146,92 @@ class Transaction(Entity):
         vo_desc = Descricao.criar_de_texto(descricao)
 
         # Valor monetário (obrigatório)
-        vo_valor = (
-            valor_monetario
-            if isinstance(valor_monetario, Valor)
-            else Valor.criar_de_bruto(valor_monetario)
-        )
+        vo_valor = _coagir_valor(valor_monetario)
 
         # Tipo de transação
-        if isinstance(tipo, TransactionType):
-            vo_tipo = tipo
-        elif tipo is None:
-            vo_tipo = TransactionType.criar_de_nome("ENTRADA")
-        else:
-            vo_tipo = TransactionType.criar_de_codigo(tipo)
-
-        instancia = cls(
-            descricao=vo_desc,
-            data_evento=vo_data,
-            valor=vo_valor,
-            tipo=vo_tipo,
+        vo_tipo = _coagir_tipo(tipo)
+
+        return cls._montar(
+            identificador, criado_em, atualizado_em, None, vo_desc, vo_data, vo_valor, vo_tipo
         )
-        # Ajusta campos de identidade/auditoria
+
+    @classmethod
+    def _montar(
+        cls,
+        identificador: UUID,
+        criado_em: datetime,
+        atualizado_em: Optional[datetime],
+        deletado_em: Optional[datetime],
+        descricao: Descricao,
+        data_evento: EventoData,
+        valor: Valor,
+        tipo: TransactionType,
+    ) -> "Transaction":
+        # Escrita direta nos slots: identidade/auditoria vêm do banco, então __init__ (que
+        # geraria UUID e timestamp descartáveis) não é executado.
+        instancia = object.__new__(cls)
         instancia.id = identificador
         instancia.created_at = criado_em
         instancia.updated_at = atualizado_em
+        instancia.deleted_at = deletado_em
+        instancia.descricao = descricao
+        instancia.data_evento = data_evento
+        instancia.valor = valor
+        instancia.tipo = tipo
         return instancia
 
+    # CRUD - Reconstituir em lote (hidratação de muitas linhas do banco)
+    @classmethod
+    def reconstituir_lote(
+        cls, registros: Iterable[Mapping[str, Any]]
+    ) -> list["Transaction"]:
+        """Reconstitui transações a partir de registros no formato de `como_registro_banco`.
+
+        Cada valor bruto distinto (descrição, data, centavos, tipo) vira VO uma única vez
+        no lote e é compartilhado entre as linhas (VOs são imutáveis). As instâncias são
+        montadas por `_montar`, sem passar por __init__.
+        """
+        descricoes: dict[str, Descricao] = {}
+        datas: dict[date, EventoData] = {}
+        valores: dict[int, Valor] = {}
+        tipos: dict[str, TransactionType] = {}
+
+        transacoes: list[Transaction] = []
+        for registro in registros:
+            texto = registro["descricao"]
+            vo_desc = descricoes.get(texto)
+            if vo_desc is None:
+                vo_desc = descricoes[texto] = Descricao.criar_de_texto(texto)
+
+            data_banco = registro["data_evento"]
+            vo_data = datas.get(data_banco)
+            if vo_data is None:
+                vo_data = datas[data_banco] = EventoData.criar_de_data(data_banco)
+
+            centavos = registro["valor_monetario_centavos"]
+            vo_valor = valores.get(centavos)
+            if vo_valor is None:
+                vo_valor = valores[centavos] = Valor.criar_de_centavos(centavos)
+
+            nome_tipo = registro["tipo"]
+            vo_tipo = tipos.get(nome_tipo)
+            if vo_tipo is None:
+                vo_tipo = tipos[nome_tipo] = TransactionType.criar_de_nome(nome_tipo)
+
+            transacoes.append(
+                cls._montar(
+                    registro["identificador"],
+                    registro["criado_em"],
+                    registro.get("atualizado_em"),
+                    registro.get("deletado_em"),
+                    vo_desc,
+                    vo_data,
+                    vo_valor,
+                    vo_tipo,
+                )
+            )
+        return transacoes
+
     # CRUD - Atualizar (update completo)
     def atualizar(
         self,
@@ -132,20 +243,8 @@ class Transaction(Entity):
         """Atualiza todos os campos da transação."""
         self.descricao = Descricao.criar_de_texto(descricao_transacao)
         self.data_evento = EventoData.criar_de_texto(texto_data_evento)
-        self.valor = (
-            valor_monetario
-            if isinstance(valor_monetario, Valor)
-            else Valor.criar_de_bruto(valor_monetario)
-        )
-        self.tipo = (
-            tipo
-            if isinstance(tipo, TransactionType)
-            else (
-                TransactionType.criar_de_codigo(tipo)
-                if tipo is not None
-                else TransactionType.criar_de_nome("ENTRADA")
-            )
-        )
+        self.valor = _coagir_valor(valor_monetario)
+        self.tipo = _coagir_tipo(tipo)
         self.registrar_atualizacao()
 
     # CRUD - Patch (atualização parcial)
@@ -164,18 +263,10 @@ class Transaction(Entity):
             self.data_evento = EventoData.criar_de_texto(texto_data_evento)
         
         if valor_monetario is not None:
-            self.valor = (
-                valor_monetario
-                if isinstance(valor_monetario, Valor)
-                else Valor.criar_de_bruto(valor_monetario)
-            )
+            self.valor = _coagir_valor(valor_monetario)
         
         if tipo is not None:
-            self.tipo = (
-                tipo
-                if isinstance(tipo, TransactionType)
-                else TransactionType.criar_de_codigo(tipo)
-            )
+            self.tipo = _coagir_tipo(tipo)
         
         self.registrar_atualizacao()
 
@@ -196,3 +287,17 @@ class Transaction(Entity):
             "atualizado_em": self.updated_at,
             "deletado_em": self.deleted_at,
         }
+
+    def como_linha_banco(self) -> TransactionRow:
+        """Mesma informação de `como_registro_banco` como tupla: sem dict nem chaves por
+        linha, pronta para inserções em lote (executemany/COPY) na ordem das colunas."""
+        return TransactionRow(
+            self.id,
+            self.descricao.para_banco(),
+            self.data_evento.para_banco(),
+            self.valor.to_centavos(),
+            self.tipo.para_banco(),
+            self.created_at,
+            self.updated_at,
+            self.deleted_at,
+        )
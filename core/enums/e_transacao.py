@@ -1,8 +1,8 @@
 
-from enum import Enum
+from enum import IntEnum
 
 
-class ETransaction(Enum):
+class ETransaction(IntEnum):
     """Enumeração para categorizar transações financeiras."""
     ENTRADA = 1
     SAIDA = 2
@@ -1,81 +1,102 @@
 from __future__ import annotations
 
+import secrets
+import time
 import uuid as _uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import ClassVar, Optional
-
-# Prefer uuid_extensions.uuid7 (from PyPI package uuid7), fallback to uuid6.uuid7, then stdlib if available
+from functools import partial
+from typing import Callable, Optional
+
+def _uuid7_local() -> _uuid.UUID:
+    # 48-bit ms timestamp + random bits; one token_bytes call and C-level slicing
+    # instead of per-byte shifts. time_ns() avoids the float round-trip of time().
+    raw = bytearray(secrets.token_bytes(16))
+    raw[0:6] = (time.time_ns() // 1_000_000).to_bytes(6, "big")
+    raw[6] = (raw[6] & 0x0F) | 0x70  # version 7
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return _uuid.UUID(bytes=bytes(raw))
+
+
+def _uuid7_batch(n: int) -> list[_uuid.UUID]:
+    # Bulk variant of _uuid7_local: a single token_bytes(16 * n) draw and one timestamp
+    # for the whole batch (every id shares the same ms prefix; the random tail keeps them unique).
+    raw = bytearray(secrets.token_bytes(16 * n))
+    ts = (time.time_ns() // 1_000_000).to_bytes(6, "big")
+    ids: list[_uuid.UUID] = []
+    for off in range(0, 16 * n, 16):
+        raw[off : off + 6] = ts
+        raw[off + 6] = (raw[off + 6] & 0x0F) | 0x70  # version 7
+        raw[off + 8] = (raw[off + 8] & 0x3F) | 0x80  # RFC 4122 variant
+        ids.append(_uuid.UUID(bytes=bytes(raw[off : off + 16])))
+    return ids
+
+
+# Resolved once at import: uuid_extensions.uuid7 (from PyPI package uuid7), then uuid6.uuid7,
+# then stdlib (if available), then the local implementation. default_factory calls the
+# chosen function directly, with no per-instance fallback checks.
+_generate_uuid7: Callable[[], _uuid.UUID]
 try:  # pragma: no cover - import resolution
-    from uuid_extensions import uuid7 as _uuid7_fn  # type: ignore
-except Exception:  # pragma: no cover
-    _uuid7_fn = None  # type: ignore[assignment]
-
-try:  # pragma: no cover
-    import uuid6 as _uuid6_mod  # type: ignore
+    from uuid_extensions import uuid7 as _generate_uuid7  # type: ignore
 except Exception:  # pragma: no cover
-    _uuid6_mod = None  # type: ignore[assignment]
+    try:
+        from uuid6 import uuid7 as _generate_uuid7  # type: ignore
+    except Exception:
+        _generate_uuid7 = getattr(_uuid, "uuid7", _uuid7_local)
 
 
-def _generate_uuid7() -> _uuid.UUID:
-    # 1) uuid_extensions (preferred)
-    if _uuid7_fn is not None:
-        return _uuid7_fn()
-    # 2) uuid6 fallback
-    if _uuid6_mod is not None:
-        return _uuid6_mod.uuid7()
-    # 3) stdlib (if present in this Python)
-    if hasattr(_uuid, "uuid7"):
-        return getattr(_uuid, "uuid7")()  # type: ignore[misc]
-    # Should not happen given dependencies; raise to surface misconfiguration
-    raise RuntimeError("Nenhuma implementação de UUIDv7 disponível. Instale 'uuid7' ou 'uuid6'.")
+# Bound once: audit stamps skip the global/attribute lookups on every call
+_UTC = timezone.utc
+_now = datetime.now
+# partial is called in C, so default_factory runs no Python frame per instance
+_now_utc: Callable[[], datetime] = partial(_now, _UTC)
 
 
-@dataclass(kw_only=True)
+@dataclass(slots=True, kw_only=True)
 class Entity:
-    """Base entity: generates UUIDv7 and created_at (UTC) automatically on instantiation."""
+    """Base entity: generates UUIDv7 and created_at (UTC) automatically on instantiation.
+
+    Slotted so that subclasses declared with ``@dataclass(slots=True)`` really drop the
+    per-instance ``__dict__``. ORM-mapped subclasses (ContaLuz, ContaAgua) stay without
+    slots on purpose: SQLAlchemy instrumentation needs the instance ``__dict__``.
+
+    The dataclass-generated ``__init__`` fills all four fields through their defaults.
+    Subclasses with a custom ``__init__`` (e.g. Transaction) must assign them themselves.
+    """
 
     # Time-based identity (UUIDv7)
     id: _uuid.UUID = field(init=False, default_factory=_generate_uuid7)
 
     # Basic auditing
-    created_at: datetime = field(init=False, default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: Optional[datetime] = field(default=None, init=False)
-    deleted_at: Optional[datetime] = field(default=None, init=False)
-
-    # Reserved fields
-    _RESERVED: ClassVar[frozenset[str]] = frozenset(
-        {"id", "created_at", "updated_at", "deleted_at"}
-    )
-
-    def __post_init__(self) -> None:
-        # Ensure initialization even when subclasses define custom __init__
-        if not isinstance(getattr(self, "id", None), _uuid.UUID):
-            self.id = _generate_uuid7()
-        if getattr(self, "created_at", None) is None:
-            self.created_at = datetime.now(timezone.utc)
+    created_at: datetime = field(init=False, default_factory=_now_utc)
+    # default_factory rather than default: a slotted Entity has no class-level None to fall
+    # back on, so every generated __init__ (slotted or not) must assign these. NoneType()
+    # returns None and is called in C.
+    updated_at: Optional[datetime] = field(init=False, default_factory=type(None))
+    deleted_at: Optional[datetime] = field(init=False, default_factory=type(None))
 
     @property
     def is_deleted(self) -> bool:
         return self.deleted_at is not None
 
     # Portuguese legacy methods (kept for compatibility)
-    def registrar_atualizacao(self) -> None:
-        self.updated_at = datetime.now(timezone.utc)
+    # `at` lets batch callers stamp N entities with a single precomputed now.
+    def registrar_atualizacao(self, at: Optional[datetime] = None) -> None:
+        self.updated_at = at if at is not None else _now(_UTC)
 
-    def registrar_exclusao(self) -> None:
-        self.deleted_at = datetime.now(timezone.utc)
+    def registrar_exclusao(self, at: Optional[datetime] = None) -> None:
+        self.deleted_at = at if at is not None else _now(_UTC)
 
-    def restaurar_exclusao(self) -> None:
+    def restaurar_exclusao(self, at: Optional[datetime] = None) -> None:
         self.deleted_at = None
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = at if at is not None else _now(_UTC)
 
     # English aliases (preferred going forward)
-    def register_update(self) -> None:
-        self.registrar_atualizacao()
+    def register_update(self, at: Optional[datetime] = None) -> None:
+        self.registrar_atualizacao(at)
 
-    def register_deletion(self) -> None:
-        self.registrar_exclusao()
+    def register_deletion(self, at: Optional[datetime] = None) -> None:
+        self.registrar_exclusao(at)
 
-    def restore_deletion(self) -> None:
-        self.restaurar_exclusao()
+    def restore_deletion(self, at: Optional[datetime] = None) -> None:
+        self.restaurar_exclusao(at)
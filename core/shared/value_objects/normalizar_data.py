@@ -7,6 +7,9 @@ from datetime import date
 # Regex compilada para melhor desempenho em parsing repetido
 _PADRAO_DATA_DD_MM_YYYY = re.compile(r"\b(\d{1,2})/(\d{1,2})/(\d{4})\b")
 
+# "00".."99" pré-formatados: indexar a tupla evita o format spec ":02d" a cada VO
+_PAD2: tuple[str, ...] = tuple(f"{i:02d}" for i in range(100))
+
 
 @dataclass(frozen=True, slots=True)
 class NormalizarData:
@@ -25,13 +28,27 @@ class NormalizarData:
 
     def __post_init__(self) -> None:
         texto_entrada = self.data.strip()
-        correspondencia = _PADRAO_DATA_DD_MM_YYYY.search(texto_entrada)
-        if not correspondencia:
-            raise ValueError(f"Data inválida: '{self.data}'. Esperado DD/MM/YYYY.")
+        # Caminho rápido: "D/M/YYYY".."DD/MM/YYYY" limpo dispensa o motor de regex
+        partes = texto_entrada.split("/")
+        if (
+            len(partes) == 3
+            and texto_entrada.isascii()
+            and 1 <= len(partes[0]) <= 2
+            and 1 <= len(partes[1]) <= 2
+            and len(partes[2]) == 4
+            and partes[0].isdigit()
+            and partes[1].isdigit()
+            and partes[2].isdigit()
+        ):
+            dia, mes, ano = int(partes[0]), int(partes[1]), int(partes[2])
+        else:
+            correspondencia = _PADRAO_DATA_DD_MM_YYYY.search(texto_entrada)
+            if not correspondencia:
+                raise ValueError(f"Data inválida: '{self.data}'. Esperado DD/MM/YYYY.")
 
-        dia = int(correspondencia.group(1))
-        mes = int(correspondencia.group(2))
-        ano = int(correspondencia.group(3))
+            dia = int(correspondencia.group(1))
+            mes = int(correspondencia.group(2))
+            ano = int(correspondencia.group(3))
 
         # Validação precisa e rápida via datetime.date
         try:
@@ -39,7 +56,7 @@ class NormalizarData:
         except ValueError as erro:
             raise ValueError(f"Data inválida: {erro}") from None
 
-        data_br_normalizada = f"{dia:02d}/{mes:02d}/{ano}"
+        data_br_normalizada = f"{_PAD2[dia]}/{_PAD2[mes]}/{ano}"
         data_iso_normalizada = data_validada.isoformat()  # YYYY-MM-DD
 
         # Atribuição em dataclass congelado
@@ -1,8 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 
+from core.shared.value_objects.normalizar_data import _PAD2
+
+# Regex compiladas uma única vez (caminho lento: sufixos, espaços, texto ao redor)
+_SUFIXO_ATUAL = re.compile(r"\s*\(atual\)\s*$", flags=re.IGNORECASE)
+_PADRAO_MM_YYYY = re.compile(r"\b(\d{2})/(\d{4})\b")
+
 
 @dataclass(frozen=True, slots=True)
 class ReferenciaMensal:
@@ -18,26 +25,41 @@ class ReferenciaMensal:
 
     def __post_init__(self) -> None:
         texto = self.referencia.strip()
-        # Remove sufixo opcional (Atual)
-        texto = re.sub(r"\s*\(atual\)\s*$", "", texto, flags=re.IGNORECASE)
-        # Busca MM/YYYY em qualquer posição
-        match = re.search(r"\b(\d{2})/(\d{4})\b", texto)
-        if not match:
-            raise ValueError(
-                f"Referência inválida: '{self.referencia}'. Esperado MM/YYYY."
-            )
-        mes = int(match.group(1))
-        ano = int(match.group(2))
+        # Caminho rápido: texto já limpo "MM/YYYY" dispensa o motor de regex
+        if len(texto) == 7 and texto[2] == "/" and texto.isascii():
+            mes_texto, ano_texto = texto[:2], texto[3:]
+            if not (mes_texto.isdigit() and ano_texto.isdigit()):
+                mes_texto = ""
+        else:
+            mes_texto = ""
+        if not mes_texto:
+            # Remove sufixo opcional (Atual)
+            texto = _SUFIXO_ATUAL.sub("", texto)
+            # Busca MM/YYYY em qualquer posição
+            match = _PADRAO_MM_YYYY.search(texto)
+            if not match:
+                raise ValueError(
+                    f"Referência inválida: '{self.referencia}'. Esperado MM/YYYY."
+                )
+            mes_texto, ano_texto = match.group(1), match.group(2)
+        mes = int(mes_texto)
+        ano = int(ano_texto)
         if mes < 1 or mes > 12:
-            raise ValueError(f"Mês inválido na referência: '{match.group(1)}'.")
+            raise ValueError(f"Mês inválido na referência: '{mes_texto}'.")
 
-        normalizada = f"{mes:02d}/{ano}"
+        normalizada = f"{_PAD2[mes]}/{ano}"
 
         # Atribuição em dataclass congelado
         object.__setattr__(self, "referencia", normalizada)
         object.__setattr__(self, "mes", mes)
         object.__setattr__(self, "ano", ano)
 
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def de_texto(cls, texto: str) -> "ReferenciaMensal":
+        """Fábrica com cache: poucos meses distintos se repetem nas importações."""
+        return cls(texto)
+
     def __str__(self) -> str:  # pragma: no cover
         return self.referencia
 
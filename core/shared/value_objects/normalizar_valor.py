@@ -1,9 +1,63 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from decimal import Decimal, InvalidOperation, ROUND_HALF_EVEN
-from typing import Union
-import re
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+
+# Constantes Decimal criadas uma única vez (evita parsear "0.01" a cada VO)
+_Q2 = Decimal("0.01")
+_HUNDRED = Decimal(100)
+
+# "1.234,56" -> "1234.56": remove o ponto de milhar e troca a vírgula decimal por ponto
+_MILHAR_PONTO_DECIMAL_VIRGULA = str.maketrans({".": None, ",": "."})
+
+# Inteiros abaixo deste módulo viram centavos sem Decimal (acima, o quantize decide)
+_LIMITE_INTEIRO = 10**18
+
+
+def _normalizar_texto(bruto: str) -> str:
+    """Converte texto monetário BR/US para o formato aceito por Decimal (ex.: "1234.56")."""
+    # Remove símbolo de moeda (R$) e todo espaço em branco, sem motor de regex:
+    # replace + split()/join rodam em C e equivalem ao antigo re.sub(r"\s|R\$").
+    texto = "".join(bruto.replace("R$", "").split())
+
+    # Regras de normalização:
+    # - Se houver vírgula e ponto: assumir ponto como milhar e vírgula como decimal (ex.: 1.234,56)
+    # - Se houver apenas vírgula: tratá-la como decimal (ex.: 1234,56 -> 1234.56)
+    # - Se não houver vírgula: manter ponto como decimal, se houver (ex.: 1234.5 -> 1234.5)
+    # A vírgula é procurada uma única vez; no caso "ambos" um só translate remove os
+    # pontos e troca a vírgula, em vez de dois replace.
+    if "," not in texto:
+        return texto  # já está em formato com ponto decimal ou inteiro
+    if "." in texto:
+        return texto.translate(_MILHAR_PONTO_DECIMAL_VIRGULA)
+    return texto.replace(",", ".")
+
+
+def _centavos_de_texto(texto: str) -> Optional[int]:
+    """Centavos exatos de um texto já normalizado como "[-]1234[.5[6]]", sem Decimal.
+
+    Retorna None para qualquer outra forma (expoente, mais de 2 casas, sinal "+", ...),
+    deixando o caso para o caminho Decimal, que arredonda e valida.
+    """
+    negativo = texto[:1] == "-"
+    if negativo:
+        texto = texto[1:]
+    inteiro, ponto, fracao = texto.partition(".")
+    # Até 18 dígitos inteiros: bem dentro da precisão do contexto Decimal (28)
+    if not (texto.isascii() and inteiro.isdigit() and len(inteiro) <= 18):
+        return None
+    if ponto:
+        if not (0 < len(fracao) <= 2 and fracao.isdigit()):
+            return None
+        centavos = int(inteiro) * 100 + int(fracao) * (10 if len(fracao) == 1 else 1)
+    else:
+        centavos = int(inteiro) * 100
+    return -centavos if negativo else centavos
 
 
 @dataclass(frozen=True, slots=True)
@@ -14,7 +68,7 @@ class ValorMonetario:
 
     def __post_init__(self) -> None:
         # Garante 2 casas decimais
-        normalizado = self.valor.quantize(Decimal("0.01"))
+        normalizado = self.valor.quantize(_Q2)
         object.__setattr__(self, "valor", normalizado)
 
     @classmethod
@@ -22,27 +76,16 @@ class ValorMonetario:
         if isinstance(bruto, Decimal):
             valor = bruto
 
+        elif isinstance(bruto, int) and not isinstance(bruto, bool):
+            # Decimal aceita int diretamente (exato), sem o str() intermediário
+            valor = Decimal(bruto)
+
         elif isinstance(bruto, (int, float)):
+            # float passa por str() para usar a representação curta (0.1 -> "0.1")
             valor = Decimal(str(bruto))
 
         elif isinstance(bruto, str):
-            texto = bruto.strip()
-            # Remove espaços e símbolo de moeda (R$)
-            texto = re.sub(r"\s|R\$", "", texto)
-
-            # Regras de normalização:
-            # - Se houver vírgula e ponto: assumir ponto como milhar e vírgula como decimal (ex.: 1.234,56)
-            # - Se houver apenas vírgula: tratá-la como decimal (ex.: 1234,56 -> 1234.56)
-            # - Se não houver vírgula: manter ponto como decimal, se houver (ex.: 1234.5 -> 1234.5)
-            if "," in texto and "." in texto:
-                texto_normalizado = texto.replace(".", "").replace(",", ".")
-            elif "," in texto:
-                texto_normalizado = texto.replace(",", ".")
-            else:
-                texto_normalizado = (
-                    texto  # já está em formato com ponto decimal ou inteiro
-                )
-
+            texto_normalizado = _normalizar_texto(bruto)
             try:
                 valor = Decimal(texto_normalizado)
             except InvalidOperation as exc:
@@ -54,13 +97,56 @@ class ValorMonetario:
 
     @classmethod
     def from_centavos(cls, centavos: int) -> "ValorMonetario":
-        valor = (Decimal(int(centavos)) / Decimal(100)).quantize(Decimal("0.01"))
+        # int() antes do cache: 150.7 vira 150 centavos e a chave é sempre o inteiro
+        return cls._from_centavos_inteiros(int(centavos))
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _from_centavos_inteiros(cls, centavos: int) -> "ValorMonetario":
+        # VO imutável: o mesmo inteiro devolve sempre a mesma instância
+        valor = (Decimal(centavos) / _HUNDRED).quantize(_Q2)
         return cls(valor)
 
+    @classmethod
+    def centavos_from_bruto(cls, bruto: Union[str, int, float, Decimal]) -> int:
+        """Centavos de uma entrada bruta, sem montar o VO quando só o inteiro interessa.
+
+        Textos simples ("R$ 1.234,56", "10,5", "-3") e inteiros são convertidos direto
+        para int; os demais casos passam por `from_bruto` e têm o mesmo resultado.
+        """
+        if type(bruto) is int and -_LIMITE_INTEIRO < bruto < _LIMITE_INTEIRO:
+            return bruto * 100
+        if type(bruto) is str:
+            centavos = _centavos_de_texto(_normalizar_texto(bruto))
+            if centavos is not None:
+                return centavos
+        return cls.from_bruto(bruto).to_centavos()
+
+    @classmethod
+    def centavos_from_bruto_lote(
+        cls, brutos: Iterable[Union[str, int, float, Decimal]]
+    ) -> np.ndarray:
+        """Coluna int64 de centavos para importações em lote (extratos, planilhas).
+
+        Cada entrada bruta distinta é convertida uma única vez por `centavos_from_bruto`;
+        repetições (valores recorrentes) reaproveitam o resultado.
+        """
+        ja_convertidos: dict[tuple[type, object], int] = {}
+
+        def centavos(bruto: Union[str, int, float, Decimal]) -> int:
+            # O tipo entra na chave: True == 1 e 1.0 == 1, mas não devem compartilhar resultado
+            chave = (type(bruto), bruto)
+            try:
+                return ja_convertidos[chave]
+            except KeyError:
+                resultado = ja_convertidos[chave] = cls.centavos_from_bruto(bruto)
+                return resultado
+
+        return np.fromiter(map(centavos, brutos), dtype=np.int64)
+
     def to_centavos(self) -> int:
-        return int(
-            (self.valor * Decimal(100)).quantize(Decimal("1"), rounding=ROUND_HALF_EVEN)
-        )
+        # `valor` já está quantizado em 2 casas: deslocar o expoente é exato, sem arredondar
+        return int(self.valor.scaleb(2))
 
     def __str__(self) -> str:  # pragma: no cover
         return f"{self.valor:.2f}"
@@ -1,16 +1,18 @@
 from core.shared.value_objects import ReferenciaMensal, ValorMonetario
-from .descricao import Descricao as Description
 from .descricao import Descricao
-from .mes_referencia import MesReferencia as ReferenceMonth
 from .mes_referencia import MesReferencia
 from .transaction_type import TransactionType
-from .valor import Valor as MonetaryValue
 from .valor import Valor
-from .evento_data import EventoData as EventDate
 from .evento_data import EventoData
-from .tipo_despesa import TipoDespesa as ExpenseType
 from .tipo_despesa import TipoDespesa
 
+# English aliases
+Description = Descricao
+ReferenceMonth = MesReferencia
+MonetaryValue = Valor
+EventDate = EventoData
+ExpenseType = TipoDespesa
+
 __all__ = [
     # Legacy Portuguese exports
     "ReferenciaMensal",
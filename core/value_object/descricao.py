@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import ClassVar
 
@@ -16,17 +17,24 @@ class Descricao:
 
     descricao: str
     TAMANHO_MAXIMO: ClassVar[int] = 150
+    # Descrições curtas se repetem muito ("Aluguel", "Combustível"): internadas, compartilham
+    # a mesma string entre instâncias e comparam por identidade em dicts/sets
+    TAMANHO_MAXIMO_INTERNADA: ClassVar[int] = 64
 
     def __init__(self, *_args, **_kwargs) -> None:  # type: ignore[override]
         raise TypeError("Use as fábricas da classe (ex.: Descricao.criar_de_texto).")
 
     @classmethod
     def _validar_e_normalizar_texto(cls, texto: str) -> str:
-        normalizado = " ".join(texto.strip().split())
-        if len(normalizado) == 0:
+        # split() sem argumentos já descarta as bordas, dispensando o strip()
+        normalizado = " ".join(texto.split())
+        tamanho = len(normalizado)
+        if tamanho == 0:
             raise ValueError("Descrição não pode ser vazia.")
-        if len(normalizado) > cls.TAMANHO_MAXIMO:
+        if tamanho > cls.TAMANHO_MAXIMO:
             raise ValueError(f"Descrição deve ter no máximo {cls.TAMANHO_MAXIMO} caracteres.")
+        if tamanho <= cls.TAMANHO_MAXIMO_INTERNADA:
+            return sys.intern(normalizado)
         return normalizado
 
     @classmethod
@@ -54,7 +62,14 @@ class Descricao:
 
     # Verificações
     def esta_normalizada(self) -> bool:
-        return self.descricao == type(self)._validar_e_normalizar_texto(self.descricao)
+        d = self.descricao
+        # Invariantes baratas primeiro; sem renormalizar o texto inteiro
+        if not d or len(d) > self.TAMANHO_MAXIMO or d[0] == " " or d[-1] == " " or "  " in d:
+            return False
+        # Texto imprimível só pode conter o espaço ASCII como espaço em branco
+        if d.isprintable():
+            return True
+        return d == " ".join(d.split())
 
     def __str__(self) -> str:
         return self.descricao
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Union
 
-from core.shared.value_objects.normalizar_data import NormalizarData
+from core.shared.value_objects.normalizar_data import _PAD2, NormalizarData
+
+
+# VO imutável: datas repetidas (ex.: importação em lote) compartilham a mesma instância
+@lru_cache(maxsize=4096)
+def _evento_data_de_partes(cls: type["EventoData"], ano: int, mes: int, dia: int) -> "EventoData":
+    return cls._criar_de_partes(dia, mes, ano)
 
 
 class EventoData(NormalizarData):
@@ -13,6 +20,9 @@ class EventoData(NormalizarData):
     - Provides factories, persistence helpers, and semantic aliases for the domain.
     """
 
+    # No new fields: keep the base slot layout, without a per-instance __dict__
+    __slots__ = ()
+
     def __init__(self, *_args, **_kwargs) -> None:  # type: ignore[override]
         raise TypeError(
             "Use the class factories (e.g., DataEvento.criar_de_texto or criar_de_data)."
@@ -20,14 +30,26 @@ class EventoData(NormalizarData):
 
     @classmethod
     def _criar_interno(cls, texto: str) -> "EventoData":
-        base = NormalizarData(texto)
         instancia = object.__new__(cls)
-        # Copy normalized state from base Value Object
-        object.__setattr__(instancia, "data", base.data)
-        object.__setattr__(instancia, "dia", base.dia)
-        object.__setattr__(instancia, "mes", base.mes)
-        object.__setattr__(instancia, "ano", base.ano)
-        object.__setattr__(instancia, "data_iso", base.data_iso)
+        # Run the base normalization on this instance (same slots), instead of building a
+        # throwaway NormalizarData and copying its five fields over
+        object.__setattr__(instancia, "data", texto)
+        NormalizarData.__post_init__(instancia)
+        return instancia  # type: ignore[return-value]
+
+    @classmethod
+    def _criar_de_partes(cls, dia: int, mes: int, ano: int) -> "EventoData":
+        """Build from the parts of an existing date, without re-parsing text."""
+        if ano < 1000:
+            # DD/MM/YYYY requires four year digits; let the text path reject it
+            return cls._criar_interno(f"{dia:02d}/{mes:02d}/{ano}")
+        dd, mm = _PAD2[dia], _PAD2[mes]
+        instancia = object.__new__(cls)
+        object.__setattr__(instancia, "data", f"{dd}/{mm}/{ano}")
+        object.__setattr__(instancia, "dia", dia)
+        object.__setattr__(instancia, "mes", mes)
+        object.__setattr__(instancia, "ano", ano)
+        object.__setattr__(instancia, "data_iso", f"{ano}-{mm}-{dd}")
         return instancia  # type: ignore[return-value]
 
     # Declarative factories
@@ -37,7 +59,7 @@ class EventoData(NormalizarData):
 
     @classmethod
     def criar_de_data(cls, valor_data: Union[date, datetime]) -> "EventoData":
-        return cls._criar_interno(f"{valor_data.day:02d}/{valor_data.month:02d}/{valor_data.year}")
+        return _evento_data_de_partes(cls, valor_data.year, valor_data.month, valor_data.day)
 
     # Persistence helpers
     def para_banco(self) -> date:
@@ -59,4 +81,8 @@ class EventoData(NormalizarData):
 
     def esta_normalizada(self) -> bool:
         """Check if internal representation is DD/MM/YYYY consistent with parsed parts."""
-        return self.data == f"{self.dia:02d}/{self.mes:02d}/{self.ano}"
+        dia, mes = self.dia, self.mes
+        # Cheap guard before formatting; _PAD2 lookups avoid the ":02d" format spec
+        if not (1 <= dia <= 31 and 1 <= mes <= 12 and len(self.data) == 10):
+            return False
+        return self.data == f"{_PAD2[dia]}/{_PAD2[mes]}/{self.ano}"
@@ -8,11 +8,31 @@ Mantém semântica de Value Object (imutável e igualdade por valor).
 """
 
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Tuple, Union
 
 from core.shared.value_objects import ReferenciaMensal
 
 
+# VO imutável: todas as contas do mesmo mês compartilham a mesma instância
+@lru_cache(maxsize=1024)
+def _mes_referencia_de_partes(cls: type["MesReferencia"], ano: int, mes: int) -> "MesReferencia":
+    return cls._criar_interno(f"{mes:02d}/{ano}")
+
+
+# Poucos textos distintos por relatório ("09/2025", "09/2025 (Atual)"...): reaproveita o parse
+@lru_cache(maxsize=256)
+def _mes_referencia_de_texto(cls: type["MesReferencia"], texto: str) -> "MesReferencia":
+    return cls._criar_interno(texto)
+
+
+
+# date é imutável: o primeiro dia de cada mês é montado uma vez e compartilhado
+@lru_cache(maxsize=2048)
+def _primeiro_dia_do_mes(ano: int, mes: int) -> date:
+    return date(ano, mes, 1)
+
+
 class MesReferencia(ReferenciaMensal):
     """Value Object do domínio para representar uma referência mensal.
 
@@ -21,6 +41,9 @@ class MesReferencia(ReferenciaMensal):
     - `para_banco()` retorna `date(ano, mes, 1)` (ótimo para Postgres/filters).
     """
 
+    # Sem campos novos: mantém o layout de slots da base, sem __dict__ por instância
+    __slots__ = ()
+
     # Impede construção direta; obrigatoriedade de usar fábricas da classe
     def __init__(self, *_args, **_kwargs) -> None:  # type: ignore[override]
         raise TypeError(
@@ -30,29 +53,33 @@ class MesReferencia(ReferenciaMensal):
     # Construtor interno para uso exclusivo das fábricas
     @classmethod
     def _criar_interno(cls, texto: str) -> "MesReferencia":
-        # Usa o VO base para validar/normalizar e então copia os campos normalizados
-        base = ReferenciaMensal(texto)
+        # Roda a validação/normalização da base direto nesta instância (mesmos slots),
+        # sem criar um ReferenciaMensal descartável e copiar campo a campo
         instancia = object.__new__(cls)
-        object.__setattr__(instancia, "referencia", base.referencia)
-        object.__setattr__(instancia, "mes", base.mes)
-        object.__setattr__(instancia, "ano", base.ano)
+        object.__setattr__(instancia, "referencia", texto)
+        ReferenciaMensal.__post_init__(instancia)
         return instancia  # type: ignore[return-value]
 
     # Criação declarativa
     @classmethod
     def criar_de_texto(cls, texto: str) -> "MesReferencia":
+        if type(texto) is str:
+            return _mes_referencia_de_texto(cls, texto)
         return cls._criar_interno(texto)
 
+    @classmethod
+    def de_texto(cls, texto: str) -> "MesReferencia":  # type: ignore[override]
+        # A fábrica herdada chamaria cls(texto), bloqueado pelo __init__ acima
+        return cls.criar_de_texto(texto)
+
     @classmethod
     def criar_de_data(cls, valor_data: Union[date, datetime]) -> "MesReferencia":
-        ano = valor_data.year
-        mes = valor_data.month
-        return cls._criar_interno(f"{mes:02d}/{ano}")
+        return _mes_referencia_de_partes(cls, valor_data.year, valor_data.month)
 
     # Persistência otimizada para banco de dados
     def para_banco(self) -> date:
         """Retorna a data do primeiro dia do mês (YYYY-MM-01) para persistência em Postgres (DATE)."""
-        return date(self.ano, self.mes, 1)
+        return _primeiro_dia_do_mes(self.ano, self.mes)
 
     def como_data(self) -> date:
         """Alias para `para_banco()`, útil em consultas/filters."""
@@ -61,7 +88,7 @@ class MesReferencia(ReferenciaMensal):
     # Atualização imutável
     def atualizar_referencia(self, novo_texto: str) -> "MesReferencia":
         """Retorna um novo VO com a referência atualizada a partir de texto bruto."""
-        return type(self)._criar_interno(novo_texto)
+        return type(self).criar_de_texto(novo_texto)
 
     # Verificações
     def esta_normalizada(self) -> bool:
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Union
 
 from core.enums.e_expense_type import EExpenseType
 
+# Lookups por código/nome em dict: evitam a maquinaria de EExpenseType(...) e o fluxo por exceção
+_POR_CODIGO: dict[int, EExpenseType] = {e.value: e for e in EExpenseType}
+_POR_NOME: dict[str, EExpenseType] = {e.name: e for e in EExpenseType}
+
 
 @dataclass(frozen=True, slots=True)
 class TipoDespesa:
@@ -20,7 +25,10 @@ class TipoDespesa:
     def __init__(self, *_args, **_kwargs) -> None:  # type: ignore[override]
         raise TypeError("Use as fábricas da classe (ex.: ExpenseType.criar_de_codigo).")
 
+    # Flyweight: só existem len(EExpenseType) valores legais, então cada (classe, tipo)
+    # é construído uma única vez e reaproveitado por todas as fábricas.
     @classmethod
+    @lru_cache(maxsize=None)
     def _criar_interno(cls, tipo: EExpenseType) -> "TipoDespesa":
         instancia = object.__new__(cls)
         object.__setattr__(instancia, "tipo_despesa", tipo)
@@ -29,22 +37,22 @@ class TipoDespesa:
     # Fábricas
     @classmethod
     def criar_de_codigo(cls, codigo: Union[int, str]) -> "TipoDespesa":
-        try:
-            codigo_inteiro = int(codigo)
-        except (ValueError, TypeError):
-            raise TypeError("Código do tipo de despesa deve ser um inteiro (1, 2, 3 ou 4).")
-        try:
-            tipo = EExpenseType(codigo_inteiro)
-        except ValueError:
+        if type(codigo) is int:
+            tipo = _POR_CODIGO.get(codigo)
+        else:
+            try:
+                tipo = _POR_CODIGO.get(int(codigo))
+            except (ValueError, TypeError):
+                raise TypeError("Código do tipo de despesa deve ser um inteiro (1, 2, 3 ou 4).")
+        if tipo is None:
             mapa = ", ".join(f"{e.value}={e.name}" for e in EExpenseType)
             raise ValueError(f"Código inválido. Utilize um dos seguintes: {mapa}.")
         return cls._criar_interno(tipo)
 
     @classmethod
     def criar_de_nome(cls, nome: str) -> "TipoDespesa":
-        try:
-            tipo = EExpenseType[nome.upper()]
-        except KeyError:
+        tipo = _POR_NOME.get(nome.upper())
+        if tipo is None:
             opcoes = ", ".join(e.name for e in EExpenseType)
             raise ValueError(f"Nome inválido. Utilize um dos seguintes: {opcoes}.")
         return cls._criar_interno(tipo)
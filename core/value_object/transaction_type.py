@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Union
 
 from core.enums.e_transacao import ETransaction
 
+# Lookups por código/nome em dict: evitam a maquinaria de ETransaction(...) e o fluxo por exceção
+_POR_CODIGO: dict[int, ETransaction] = {e.value: e for e in ETransaction}
+_POR_NOME: dict[str, ETransaction] = {e.name: e for e in ETransaction}
+
 
 @dataclass(frozen=True, slots=True)
 class TransactionType:
@@ -20,7 +25,10 @@ class TransactionType:
     def __init__(self, *_args, **_kwargs) -> None:  # type: ignore[override]
         raise TypeError("Use as fábricas da classe (ex.: TransactionType.criar_de_codigo).")
 
+    # Flyweight: só existem len(ETransaction) valores legais, então cada (classe, tipo)
+    # é construído uma única vez e reaproveitado por todas as fábricas.
     @classmethod
+    @lru_cache(maxsize=None)
     def _criar_interno(cls, tipo: ETransaction) -> "TransactionType":
         instancia = object.__new__(cls)
         object.__setattr__(instancia, "tipo_transacao", tipo)
@@ -29,22 +37,22 @@ class TransactionType:
     # Fábricas
     @classmethod
     def criar_de_codigo(cls, codigo: Union[int, str]) -> "TransactionType":
-        try:
-            codigo_inteiro = int(codigo)
-        except (ValueError, TypeError):
-            raise TypeError("Código do tipo de transação deve ser um inteiro (1, 2, 3 ou 4).")
-        try:
-            tipo = ETransaction(codigo_inteiro)
-        except ValueError:
+        if type(codigo) is int:
+            tipo = _POR_CODIGO.get(codigo)
+        else:
+            try:
+                tipo = _POR_CODIGO.get(int(codigo))
+            except (ValueError, TypeError):
+                raise TypeError("Código do tipo de transação deve ser um inteiro (1, 2, 3 ou 4).")
+        if tipo is None:
             mapa = ", ".join(f"{e.value}={e.name}" for e in ETransaction)
             raise ValueError(f"Código inválido. Utilize um dos seguintes: {mapa}.")
         return cls._criar_interno(tipo)
 
     @classmethod
     def criar_de_nome(cls, nome: str) -> "TransactionType":
-        try:
-            tipo = ETransaction[nome.upper()]
-        except KeyError:
+        tipo = _POR_NOME.get(nome.upper())
+        if tipo is None:
             opcoes = ", ".join(e.name for e in ETransaction)
             raise ValueError(f"Nome inválido. Utilize um dos seguintes: {opcoes}.")
         return cls._criar_interno(tipo)
@@ -12,6 +12,7 @@ from decimal import Decimal
 from typing import Union
 
 from core.shared.value_objects import ValorMonetario
+from core.shared.value_objects.normalizar_valor import _Q2
 
 
 class Valor(ValorMonetario):
@@ -24,20 +25,27 @@ class Valor(ValorMonetario):
     - Não aceita valores negativos; zero é permitido.
     """
 
+    # Centavos (int) guardados ao lado do Decimal: to_centavos vira leitura de atributo e a
+    # aritmética com inteiros não passa por Decimal. Fica fora de eq/hash/repr (não é campo).
+    __slots__ = ("_centavos",)
+
     # Impede construção direta; obrigatoriedade de usar fábricas da classe
     def __init__(self, *_args, **_kwargs) -> None:  # type: ignore[override]
         raise TypeError(
             "Use as fábricas da classe (ex.: Valor.criar_de_bruto, Valor.criar_de_decimal)."
         )
 
-    # Construtor interno para uso exclusivo das fábricas
+    # Construtor interno para uso exclusivo das fábricas.
+    # Grava o campo direto, sem passar pelo __init__/__post_init__ do pai; só quantiza quando a
+    # fábrica pede (from_bruto já entrega 2 casas). O sinal é checado antes de quantizar.
     @classmethod
-    def _criar_interno(cls, valor_normalizado: Decimal) -> "Valor":
-        if valor_normalizado < Decimal("0.00"):
+    def _criar_interno(cls, valor_normalizado: Decimal, quantizar: bool = False) -> "Valor":
+        if valor_normalizado < 0:
             raise ValueError("Valor monetário não pode ser negativo.")
+        if quantizar:
+            valor_normalizado = valor_normalizado.quantize(_Q2)
         instancia = object.__new__(cls)
-        # Inicializa campos do dataclass pai (frozen) garantindo quantização
-        ValorMonetario.__init__(instancia, valor_normalizado)  # type: ignore[misc]
+        object.__setattr__(instancia, "valor", valor_normalizado)
         return instancia  # type: ignore[return-value]
 
     # Criação (aliases mais declarativos sobre a API herdada)
@@ -48,7 +56,18 @@ class Valor(ValorMonetario):
 
     @classmethod
     def criar_de_decimal(cls, valor_decimal: Decimal) -> "Valor":
-        return cls._criar_interno(valor_decimal)
+        return cls._criar_interno(valor_decimal, quantizar=True)
+
+    @classmethod
+    def criar_de_centavos(cls, centavos: int) -> "Valor":
+        """Cria a partir de centavos inteiros (ex.: coluna BIGINT), sem dividir nem quantizar."""
+        if centavos < 0:
+            raise ValueError("Valor monetário não pode ser negativo.")
+        instancia = object.__new__(cls)
+        # Deslocar o expoente é exato e já resulta em 2 casas (12345 -> 123.45)
+        object.__setattr__(instancia, "valor", Decimal(centavos).scaleb(-2))
+        object.__setattr__(instancia, "_centavos", centavos)
+        return instancia  # type: ignore[return-value]
 
     # Atualizações imutáveis
     def atualizar_valor(self, novo_valor: Union[str, int, float, Decimal]) -> "Valor":
@@ -57,13 +76,26 @@ class Valor(ValorMonetario):
 
     def incrementar(self, delta: Union[int, float, Decimal]) -> "Valor":
         """Soma o delta ao valor atual e retorna um novo VO."""
+        if type(delta) is int:
+            return type(self).criar_de_centavos(self.to_centavos() + delta * 100)
         soma = self.valor + Decimal(str(delta))
-        return type(self)._criar_interno(soma)
+        return type(self)._criar_interno(soma, quantizar=True)
 
     def decrementar(self, delta: Union[int, float, Decimal]) -> "Valor":
         """Subtrai o delta do valor atual e retorna um novo VO."""
+        if type(delta) is int:
+            return type(self).criar_de_centavos(self.to_centavos() - delta * 100)
         sub = self.valor - Decimal(str(delta))
-        return type(self)._criar_interno(sub)
+        return type(self)._criar_interno(sub, quantizar=True)
+
+    def to_centavos(self) -> int:
+        # Calculado uma vez por instância; o slot fica vazio até a primeira leitura
+        try:
+            return self._centavos
+        except AttributeError:
+            centavos = int(self.valor.scaleb(2))
+            object.__setattr__(self, "_centavos", centavos)
+            return centavos
 
     # Verificações
     def esta_normalizado(self) -> bool:
@@ -8,6 +8,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     Numeric,
+    Index,
 )
 from sqlalchemy.orm import registry
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
@@ -19,27 +20,53 @@ from core.entities.expenses.conta_agua import ContaAgua
 mapper_registry = registry()
 metadata_obj: MetaData = mapper_registry.metadata
 
+# --- Column types (one instance each, shared by every table) ---
+_UUID_PK = PG_UUID(as_uuid=True)
+_TIMESTAMP_TZ = DateTime(timezone=True)
+_MONEY = Numeric(12, 2, asdecimal=True)
+
 # --- Tables ---
 conta_luz_table = Table(
     "conta_luz",
     metadata_obj,
-    Column("id", PG_UUID(as_uuid=True), primary_key=True),
-    Column("created_at", DateTime(timezone=True), nullable=False),
-    Column("updated_at", DateTime(timezone=True), nullable=True),
-    Column("deleted_at", DateTime(timezone=True), nullable=True),
+    Column("id", _UUID_PK, primary_key=True),
+    Column("created_at", _TIMESTAMP_TZ, nullable=False),
+    Column("updated_at", _TIMESTAMP_TZ, nullable=True),
+    Column("deleted_at", _TIMESTAMP_TZ, nullable=True),
     Column("referencia", String(32), nullable=False),
-    Column("valor", Numeric(12, 2), nullable=False),
+    Column("valor", _MONEY, nullable=False),
+)
+# Índices parciais: os repositórios só leem linhas não deletadas
+Index(
+    "ix_conta_luz_active_created",
+    conta_luz_table.c.created_at.desc(),
+    postgresql_where=conta_luz_table.c.deleted_at.is_(None),
+)
+Index(
+    "ix_conta_luz_active_ref",
+    conta_luz_table.c.referencia,
+    postgresql_where=conta_luz_table.c.deleted_at.is_(None),
 )
 
 conta_agua_table = Table(
     "conta_agua",
     metadata_obj,
-    Column("id", PG_UUID(as_uuid=True), primary_key=True),
-    Column("created_at", DateTime(timezone=True), nullable=False),
-    Column("updated_at", DateTime(timezone=True), nullable=True),
-    Column("deleted_at", DateTime(timezone=True), nullable=True),
+    Column("id", _UUID_PK, primary_key=True),
+    Column("created_at", _TIMESTAMP_TZ, nullable=False),
+    Column("updated_at", _TIMESTAMP_TZ, nullable=True),
+    Column("deleted_at", _TIMESTAMP_TZ, nullable=True),
     Column("referencia_data", Date, nullable=False),
-    Column("valor", Numeric(12, 2), nullable=False),
+    Column("valor", _MONEY, nullable=False),
+)
+Index(
+    "ix_conta_agua_active_created",
+    conta_agua_table.c.created_at.desc(),
+    postgresql_where=conta_agua_table.c.deleted_at.is_(None),
+)
+Index(
+    "ix_conta_agua_active_ref",
+    conta_agua_table.c.referencia_data,
+    postgresql_where=conta_agua_table.c.deleted_at.is_(None),
 )
 
 entradas
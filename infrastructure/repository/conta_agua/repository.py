@@ -1,14 +1,30 @@
 # infrastructure/repository/conta_agua_endpoints.py
 from __future__ import annotations
 import logging
+import sys
 import uuid
 from typing import Iterable
-from sqlalchemy import asc, desc, select
+from sqlalchemy import Row, asc, desc, distinct, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from application.conta_agua.irepository import ContaAguaRepositoryPort
 from core.entities.expenses.conta_agua import ContaAgua
+from core.shared.entities.entity import _now_utc
 from infrastructure.data.mappings import conta_agua_table
 _logger = logging.getLogger("pessoal.infrastructure.repository.conta_agua")
+def _como_linhas(contas: Iterable[ContaAgua]) -> list[dict]:
+    """Converte entidades em dicts de colunas de conta_agua_table para comandos em lote."""
+    return [
+        {
+            "id": conta.id,
+            "created_at": conta.created_at,
+            "updated_at": conta.updated_at,
+            "deleted_at": conta.deleted_at,
+            "referencia_data": conta.referencia_data,
+            "valor": conta.valor,
+        }
+        for conta in contas
+    ]
 class ContaAguaRepository(ContaAguaRepositoryPort):
     """Repositório de persistência para ContaAgua baseado em SQLAlchemy."""
     def __init__(self, session: Session) -> None:
@@ -21,20 +37,24 @@ class ContaAguaRepository(ContaAguaRepositoryPort):
             .where(conta_agua_table.c.deleted_at.is_(None))
         )
         return self._session.execute(consulta).scalar_one_or_none()
-    def list_existing_references(self) -> set[str]:
+    def list_existing_references(self) -> frozenset[str]:
         """Retorna conjunto de referências (mm/yyyy) já persistidas (não deletadas)."""
-        consulta = select(conta_agua_table.c.referencia_data).where(
-            conta_agua_table.c.deleted_at.is_(None)
-        )
-        datas = self._session.execute(consulta).scalars().all()
-        referencias = {f"{d.month:02d}/{d.year}" for d in datas}
+        # Formata MM/YYYY e remove meses repetidos no próprio Postgres
+        consulta = select(
+            distinct(func.to_char(conta_agua_table.c.referencia_data, "MM/YYYY"))
+        ).where(conta_agua_table.c.deleted_at.is_(None))
+        # yield_per: cursor no servidor, lido em lotes direto para o set (sem lista intermediária)
+        resultado = self._session.execute(consulta.execution_options(yield_per=1000))
+        referencias = frozenset(map(sys.intern, resultado.scalars()))
         _logger.info("Fetched water references", extra={"count": len(referencias)})
         return referencias
     def add_many(self, contas: Iterable[ContaAgua]) -> int:
-        # Utiliza session.add_all() para operação em lote
-        contas_list = list(contas)
-        self._session.add_all(contas_list)
-        count = len(contas_list)
+        # Um único INSERT multi-linha (executemany) pelo Core, sem passar cada entidade
+        # pelo unit of work / identity map; as entidades são novas e só contam no resumo
+        linhas = _como_linhas(contas)
+        if linhas:
+            self._session.execute(insert(conta_agua_table), linhas)
+        count = len(linhas)
         _logger.info("Queued water entities to insert", extra={"count": count})
         return count
     def list(
@@ -65,8 +85,75 @@ class ContaAguaRepository(ContaAguaRepositoryPort):
             },
         )
         return resultados
+    def list_rows(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        include_deleted: bool = False,
+        order_desc: bool = True,
+    ) -> list[Row]:
+        """Mesma página de `list`, como linhas (referencia, valor) do Core, para leitura.
+
+        Sem hidratar entidades nem passar pelo identity map; a referência MM/YYYY já vem
+        formatada pelo Postgres.
+        """
+        consulta = select(
+            func.to_char(conta_agua_table.c.referencia_data, "MM/YYYY").label("referencia"),
+            conta_agua_table.c.valor,
+        )
+        if not include_deleted:
+            consulta = consulta.where(conta_agua_table.c.deleted_at.is_(None))
+        ordenacao = (
+            desc(conta_agua_table.c.created_at)
+            if order_desc
+            else asc(conta_agua_table.c.created_at)
+        )
+        consulta = consulta.order_by(ordenacao).offset(offset).limit(limit)
+        linhas = self._session.execute(consulta).all()
+        _logger.debug(
+            "Listed ContaAgua rows",
+            extra={"count": len(linhas), "offset": offset, "limit": limit},
+        )
+        return linhas
     def put(self, conta: ContaAgua) -> ContaAgua:
         # Upsert idempotente via merge
         merged_conta = self._session.merge(conta)
         _logger.info("Queued water entity for upsert", extra={"id": merged_conta.id})
         return merged_conta
+    def put_many(self, contas: Iterable[ContaAgua]) -> int:
+        """Upsert em lote: um INSERT ... ON CONFLICT (id) DO UPDATE, sem SELECT por linha.
+
+        Contas já removidas (deleted_at preenchido) não são atualizadas.
+        """
+        linhas = _como_linhas(contas)
+        if not linhas:
+            return 0
+        comando = pg_insert(conta_agua_table).values(linhas)
+        comando = comando.on_conflict_do_update(
+            index_elements=[conta_agua_table.c.id],
+            set_={
+                "referencia_data": comando.excluded.referencia_data,
+                "valor": comando.excluded.valor,
+                "updated_at": func.now(),
+            },
+            where=conta_agua_table.c.deleted_at.is_(None),
+        )
+        self._session.execute(comando)
+        _logger.info("Upserted water entities", extra={"count": len(linhas)})
+        return len(linhas)
+    def soft_delete(self, conta_agua_id: uuid.UUID) -> bool:
+        """Marca deleted_at/updated_at num único UPDATE por id, sem carregar a entidade.
+
+        Retorna False quando não há conta ativa com esse id.
+        """
+        agora = _now_utc()
+        comando = (
+            update(conta_agua_table)
+            .where(conta_agua_table.c.id == conta_agua_id)
+            .where(conta_agua_table.c.deleted_at.is_(None))
+            .values(deleted_at=agora, updated_at=agora)
+        )
+        removida = self._session.execute(comando).rowcount > 0
+        _logger.info("Soft-deleted water entity", extra={"id": conta_agua_id, "found": removida})
+        return removida
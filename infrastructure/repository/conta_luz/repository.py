@@ -1,38 +1,61 @@
 from __future__ import annotations
 
-from typing import Iterable, Set
-from sqlalchemy import select, asc, desc
+import sys
+import uuid
+from typing import Iterable
+from sqlalchemy import Row, distinct, func, insert, select, update, asc, desc
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 import logging
 
 from application.conta_luz.irepository import ContaLuzRepositoryPort
 from core.entities.expenses.conta_luz import ContaLuz
+from core.shared.entities.entity import _now_utc
 from infrastructure.data.mappings import conta_luz_table
 
 _logger = logging.getLogger("pessoal.infrastructure.repository.conta_luz")
 
 
+def _como_linhas(contas: Iterable[ContaLuz]) -> list[dict]:
+    """Converte entidades em dicts de colunas de conta_luz_table para comandos em lote."""
+    return [
+        {
+            "id": conta.id,
+            "created_at": conta.created_at,
+            "updated_at": conta.updated_at,
+            "deleted_at": conta.deleted_at,
+            "referencia": conta.referencia,
+            "valor": conta.valor,
+        }
+        for conta in contas
+    ]
+
+
 class ContaLuzRepository(ContaLuzRepositoryPort):
     """Repositório de persistência para ContaLuz baseado em SQLAlchemy."""
 
     def __init__(self, session: Session) -> None:
         self._session = session
 
-    def list_existing_references(self) -> Set[str]:
+    def list_existing_references(self) -> frozenset[str]:
         """Retorna um conjunto de referências (mm/yyyy) já persistidas (não deletadas)."""
-        consulta = select(conta_luz_table.c.referencia).where(
+        consulta = select(distinct(conta_luz_table.c.referencia)).where(
             conta_luz_table.c.deleted_at.is_(None)
         )
-        resultados = self._session.execute(consulta).scalars().all()
-        referencias = set(str(valor) for valor in resultados)
+        # yield_per: cursor no servidor, lido em lotes direto para o set (sem lista intermediária)
+        resultado = self._session.execute(consulta.execution_options(yield_per=1000))
+        referencias = frozenset(map(sys.intern, resultado.scalars()))
         _logger.info("Fetched existing references", extra={"count": len(referencias)})
         return referencias
 
     def add_many(self, contas: Iterable[ContaLuz]) -> int:
         """Adiciona várias entidades ContaLuz e retorna a quantidade inserida."""
-        contas_list = list(contas)
-        self._session.add_all(contas_list)
-        count = len(contas_list)
+        # Um único INSERT multi-linha (executemany) pelo Core, sem passar cada entidade
+        # pelo unit of work / identity map; as entidades são novas e só contam no resumo
+        linhas = _como_linhas(contas)
+        if linhas:
+            self._session.execute(insert(conta_luz_table), linhas)
+        count = len(linhas)
         _logger.info("Queued entities to insert", extra={"count": count})
         return count
 
@@ -66,7 +89,73 @@ class ContaLuzRepository(ContaLuzRepositoryPort):
         )
         return resultados
 
+    def list_rows(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        include_deleted: bool = False,
+        order_desc: bool = True,
+    ) -> list[Row]:
+        """Mesma página de `list`, como linhas (referencia, valor) do Core, para leitura.
+
+        Sem hidratar entidades nem passar pelo identity map.
+        """
+        consulta = select(conta_luz_table.c.referencia, conta_luz_table.c.valor)
+        if not include_deleted:
+            consulta = consulta.where(conta_luz_table.c.deleted_at.is_(None))
+        ordenacao = (
+            desc(conta_luz_table.c.created_at)
+            if order_desc
+            else asc(conta_luz_table.c.created_at)
+        )
+        consulta = consulta.order_by(ordenacao).offset(offset).limit(limit)
+        linhas = self._session.execute(consulta).all()
+        _logger.debug(
+            "Listed ContaLuz rows",
+            extra={"count": len(linhas), "offset": offset, "limit": limit},
+        )
+        return linhas
+
     def put(self, conta: ContaLuz) -> ContaLuz:
         merged = self._session.merge(conta)
         _logger.info("Queued power entity for upsert", extra={"id": merged.id})
         return merged
+
+    def put_many(self, contas: Iterable[ContaLuz]) -> int:
+        """Upsert em lote: um INSERT ... ON CONFLICT (id) DO UPDATE, sem SELECT por linha.
+
+        Contas já removidas (deleted_at preenchido) não são atualizadas.
+        """
+        linhas = _como_linhas(contas)
+        if not linhas:
+            return 0
+        comando = pg_insert(conta_luz_table).values(linhas)
+        comando = comando.on_conflict_do_update(
+            index_elements=[conta_luz_table.c.id],
+            set_={
+                "referencia": comando.excluded.referencia,
+                "valor": comando.excluded.valor,
+                "updated_at": func.now(),
+            },
+            where=conta_luz_table.c.deleted_at.is_(None),
+        )
+        self._session.execute(comando)
+        _logger.info("Upserted power entities", extra={"count": len(linhas)})
+        return len(linhas)
+
+    def soft_delete(self, conta_luz_id: uuid.UUID) -> bool:
+        """Marca deleted_at/updated_at num único UPDATE por id, sem carregar a entidade.
+
+        Retorna False quando não há conta ativa com esse id.
+        """
+        agora = _now_utc()
+        comando = (
+            update(conta_luz_table)
+            .where(conta_luz_table.c.id == conta_luz_id)
+            .where(conta_luz_table.c.deleted_at.is_(None))
+            .values(deleted_at=agora, updated_at=agora)
+        )
+        removida = self._session.execute(comando).rowcount > 0
+        _logger.info("Soft-deleted power entity", extra={"id": conta_luz_id, "found": removida})
+        return removida
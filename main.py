@@ -2,36 +2,59 @@ from __future__ import annotations
 
 """
 Entry point to start the FastAPI application.
-- Reads PORT (default: 8000) and UVICORN_RELOAD (1/true/yes/on to enable) from environment variables.
-- Runs the ASGI app defined in api.app:app.
+- Reads PORT (default: 8000), UVICORN_RELOAD (1/true/yes/on to enable), WEB_CONCURRENCY
+  (worker processes, default: 1) and UVICORN_ACCESS_LOG (default: off; the request
+  middleware already logs every request) from environment variables, once at import.
+- Runs the ASGI app defined in api.app:app. uvicorn[standard] (via fastapi[standard])
+  ships uvloop and httptools, which uvicorn's "auto" loop/http settings pick up.
 - Also exposes `app` to support `fastapi dev main.py` auto-discovery.
 """
 
 import os
-import uvicorn
 
 # Expose FastAPI app symbol for FastAPI CLI auto-discovery
 from api.app import app as app  # noqa: F401  (re-export for tooling)
 
+_TRUTHY = {"1", "true", "yes", "on"}
+
 
 def _should_reload() -> bool:
-    return os.getenv("UVICORN_RELOAD", "0").lower() in {"1", "true", "yes", "on"}
+    return os.getenv("UVICORN_RELOAD", "0").lower() in _TRUTHY
 
 
-def _get_port() -> int:
-    valor_porta = os.getenv("PORT", "8000")
+def _should_log_access() -> bool:
+    return os.getenv("UVICORN_ACCESS_LOG", "0").lower() in _TRUTHY
+
+
+def _get_int(nome: str, padrao: int) -> int:
     try:
-        return int(valor_porta)
+        return int(os.getenv(nome, str(padrao)))
     except ValueError:
-        return 8000
+        return padrao
+
+
+def _get_port() -> int:
+    return _get_int("PORT", 8000)
+
+
+# Environment read once at import
+_PORT = _get_port()
+_RELOAD = _should_reload()
+_WORKERS = _get_int("WEB_CONCURRENCY", 1)
+_ACCESS_LOG = _should_log_access()
 
 
 def main() -> None:
+    # Imported here: tooling that only needs `app` (fastapi dev, tests) skips the server stack
+    import uvicorn
+
     uvicorn.run(
         "api.app:app",
         host="0.0.0.0",
-        port=_get_port(),
-        reload=_should_reload(),
+        port=_PORT,
+        reload=_RELOAD,
+        workers=_WORKERS,
+        access_log=_ACCESS_LOG,
     )
 
 
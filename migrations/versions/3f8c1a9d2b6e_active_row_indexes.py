@@ -0,0 +1,52 @@
+"""active row indexes
+
+Revision ID: 3f8c1a9d2b6e
+Revises: 7098f9b605eb
+Create Date: 2026-10-15 09:12:37.418204
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3f8c1a9d2b6e"
+down_revision = "7098f9b605eb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial indexes: repositories only read rows with deleted_at IS NULL
+    op.create_index(
+        "ix_conta_agua_active_created",
+        "conta_agua",
+        [sa.text("created_at DESC")],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_conta_agua_active_ref",
+        "conta_agua",
+        ["referencia_data"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_conta_luz_active_created",
+        "conta_luz",
+        [sa.text("created_at DESC")],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_conta_luz_active_ref",
+        "conta_luz",
+        ["referencia"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_conta_luz_active_ref", table_name="conta_luz")
+    op.drop_index("ix_conta_luz_active_created", table_name="conta_luz")
+    op.drop_index("ix_conta_agua_active_ref", table_name="conta_agua")
+    op.drop_index("ix_conta_agua_active_created", table_name="conta_agua")
@@ -1,3 +1,4 @@
+import pytest
 import uuid
 from decimal import Decimal
 from datetime import date
@@ -34,3 +35,8 @@ def test_descricoes_e_formatos_para_banco():
     conta = ContaAgua.criar("09/2025", "1234.5")
     assert conta.descricao_curta() == "Conta de Água 09/2025: R$ 1234.50"
     assert conta.referencia_para_banco() == date(2025, 9, 1)
+
+
+def test_criar_rejeita_tipo_de_referencia_nao_suportado():
+    with pytest.raises(TypeError):
+        ContaAgua.criar(202509, "10")
@@ -36,3 +36,28 @@ def test_localizar_tabela_com_palavras_chave_any_match():
         exigir_todas=False,
     )
     assert encontrada is df
+
+
+def test_localizar_tabela_com_palavras_chave_em_colunas_nao_textuais():
+    df_numerica = pd.DataFrame({"a": [1, 2], "b": [0.5, 1.5]})
+    df_texto = pd.DataFrame({"a": ["Vencimento", "Vencimento"], "b": [None, "Total"]})
+
+    wrapper = DataFrameWrapper()
+    assert (
+        wrapper.localizar_tabela_com_palavras_chave(
+            [df_numerica, df_texto], palavras_chave=["2.0 1.5"], exigir_todas=True
+        )
+        is df_numerica
+    )
+    assert (
+        wrapper.localizar_tabela_com_palavras_chave(
+            [df_numerica, df_texto], palavras_chave=["vencimento total"]
+        )
+        is df_texto
+    )
+    assert (
+        wrapper.localizar_tabela_com_palavras_chave(
+            [df_numerica, df_texto], palavras_chave=["vencimento", "inexistente"]
+        )
+        is None
+    )
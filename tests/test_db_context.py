@@ -0,0 +1,7 @@
+from infrastructure.data.db_context import _sanitize_url
+
+
+def test_sanitize_url_mascara_a_senha_inteira():
+    assert _sanitize_url("postgresql://u:segredo@h:5432/db") == "postgresql://u:***@h:5432/db"
+    assert _sanitize_url("postgresql://u:p@ss@h/db") == "postgresql://u:***@h/db"
+    assert _sanitize_url("postgresql://u@h/db") == "postgresql://u@h/db"
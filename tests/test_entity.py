@@ -44,3 +44,38 @@ def test_subclass_controls_its_own_update_and_delete():
     inv.marcar_deletado()
     assert inv.deleted_at is not None
     assert inv.is_deleted
+
+
+def test_slotted_subclass_has_no_instance_dict():
+    inv = Invoice(descricao="Conta", valor=100)
+    assert not hasattr(inv, "__dict__")
+    assert inv.updated_at is None
+    assert inv.deleted_at is None
+
+
+def test_local_uuid7_fallback_layout():
+    from core.shared.entities.entity import _uuid7_local
+
+    first = _uuid7_local()
+    second = _uuid7_local()
+    assert first.version == 7
+    assert first.variant == uuid.RFC_4122
+    assert first != second
+
+
+def test_audit_stamps_accept_precomputed_now():
+    agora = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    invoices = [Invoice(descricao="Conta", valor=v) for v in (1, 2)]
+    for inv in invoices:
+        inv.registrar_atualizacao(agora)
+        inv.register_deletion(agora)
+    assert all(inv.updated_at == agora and inv.deleted_at == agora for inv in invoices)
+
+
+def test_uuid7_batch_layout_and_uniqueness():
+    from core.shared.entities.entity import _uuid7_batch
+
+    ids = _uuid7_batch(50)
+    assert len(set(ids)) == 50
+    assert all(u.version == 7 and u.variant == uuid.RFC_4122 for u in ids)
+    assert _uuid7_batch(0) == []
@@ -1,3 +1,6 @@
+from decimal import Decimal
+import pandas as pd
+
 from core.entities.expenses.expense_variable import ExpenseVariable
 
 
@@ -22,6 +25,10 @@ def test_expense_variable_updates_updated_at_on_changes():
     expense.patch()
     assert expense.updated_at == updated_after_patch
 
+    # Patch with the current values is a no-op as well
+    expense.patch(amount=200, event_date="01/09/2025")
+    assert expense.updated_at == updated_after_patch
+
     # Full update should update again
     expense.atualizar(
         description="Power Bill Updated",
@@ -31,3 +38,119 @@ def test_expense_variable_updates_updated_at_on_changes():
     )
     assert expense.updated_at is not None
     assert expense.updated_at >= updated_after_patch
+
+
+def test_expense_variable_reference_follows_event_date_changes():
+    expense = ExpenseVariable.criar(
+        description="Power Bill",
+        amount=100,
+        expense_type=1,
+        event_date="01/09/2025",
+    )
+    assert expense.reference == "09/2025"
+    assert expense.reference == "09/2025"
+
+    expense.patch(event_date="01/10/2025")
+    assert expense.reference == "10/2025"
+
+
+def test_expense_variable_short_description_follows_amount_changes():
+    expense = ExpenseVariable.criar(
+        description="Power Bill",
+        amount=100,
+        expense_type=1,
+        event_date="01/09/2025",
+    )
+    assert expense.short_description() == "Expense 09/2025: R$ 100.00"
+
+    expense.patch(amount=250)
+    assert expense.short_description() == "Expense 09/2025: R$ 250.00"
+
+
+def test_expense_variable_criar_muitos_matches_criar():
+    rows = pd.DataFrame(
+        {
+            "description": ["Power Bill", "Water Bill", "Power Bill"],
+            "amount": ["100,50", 80, "100,50"],
+            "expense_type": [1, "FIXA", 1],
+            "event_date": ["01/09/2025", "05/09/2025", "01/09/2025"],
+        }
+    )
+
+    expenses = ExpenseVariable.criar_muitos(rows)
+
+    assert len(expenses) == 3
+    expected = ExpenseVariable.criar(
+        description="Power Bill", amount="100,50", expense_type=1, event_date="01/09/2025"
+    )
+    first = expenses[0]
+    assert first.description == expected.description
+    assert first.amount == expected.amount
+    assert first.expense_type == expected.expense_type
+    assert first.event_date == expected.event_date
+    assert first.expense_variable_type_id is None
+    # Distinct entities sharing the same immutable VOs
+    assert first.id != expenses[2].id
+    assert first.amount is expenses[2].amount
+
+
+def test_expense_variable_sum_by_month_is_exact_and_chronological():
+    expenses = [
+        ExpenseVariable.criar(description="Luz", amount="0,10", expense_type=1, event_date="05/10/2025"),
+        ExpenseVariable.criar(description="Agua", amount="0,20", expense_type=1, event_date="20/10/2025"),
+        ExpenseVariable.criar(description="Luz", amount="100,00", expense_type=1, event_date="01/12/2024"),
+    ]
+
+    totals = ExpenseVariable.sum_by_month(expenses)
+
+    assert list(totals) == ["12/2024", "10/2025"]
+    assert totals["10/2025"] == Decimal("0.30")
+    assert totals["12/2024"] == Decimal("100.00")
+
+
+def test_expense_variable_from_row_keeps_persisted_identity():
+    original = ExpenseVariable.criar(
+        description="Power Bill", amount=100, expense_type=1, event_date="01/09/2025"
+    )
+    original.patch(amount=150)
+
+    hydrated = ExpenseVariable._from_row(
+        id=original.id,
+        description=original.description,
+        amount=original.amount,
+        expense_type=original.expense_type,
+        event_date=original.event_date,
+        expense_variable_type_id=None,
+        created_at=original.created_at,
+        updated_at=original.updated_at,
+    )
+
+    assert hydrated == original
+    assert hydrated.deleted_at is None
+    assert hydrated.reference == "09/2025"
+
+
+def test_expense_variable_slots_cover_the_whole_hierarchy():
+    # Entity -> Expense -> ExpenseVariable must all be slotted, otherwise a __dict__
+    # reappears on every instance and the slot savings are lost.
+    expense = ExpenseVariable.criar(
+        description="Power Bill", amount=100, expense_type=1, event_date="01/09/2025"
+    )
+    assert not hasattr(expense, "__dict__")
+    for klass in ExpenseVariable.__mro__[:-1]:
+        assert "__slots__" in vars(klass), klass
+
+
+def test_expense_variable_patch_amounts_only_stamps_changed_rows():
+    expenses = [
+        ExpenseVariable.criar(description="Luz", amount="10,00", expense_type=1, event_date="05/10/2025"),
+        ExpenseVariable.criar(description="Agua", amount="20,00", expense_type=1, event_date="20/10/2025"),
+    ]
+
+    changed = ExpenseVariable.patch_amounts(expenses, ["10,00", 25])
+
+    assert changed == [expenses[1]]
+    assert expenses[0].updated_at is None
+    assert expenses[1].amount.to_centavos() == 2500
+    assert expenses[1].updated_at is not None
+    assert ExpenseVariable.patch_amounts(expenses, [10, "25,00"]) == []
@@ -0,0 +1,32 @@
+from core.entities.expenses.expense_variable_type import ExpenseVariableType
+
+
+def test_expense_variable_type_patch_registers_falsy_changes():
+    tipo = ExpenseVariableType.criar(name="Energia", description="Conta de luz")
+    assert tipo.updated_at is None
+
+    # No fields provided: nothing changes
+    tipo.patch()
+    assert tipo.updated_at is None
+
+    # Falsy values are still changes and must register the update
+    tipo.patch(is_active=False)
+    assert tipo.is_active is False
+    assert tipo.updated_at is not None
+
+    # Explicit None clears the description (distinct from "not provided")
+    tipo.patch(description=None)
+    assert tipo.description is None
+
+
+def test_expense_variable_type_to_dict():
+    tipo = ExpenseVariableType.criar(name="Energia", description="Conta de luz")
+    dados = tipo.to_dict()
+
+    assert dados["id"] == tipo.id
+    assert dados["name"] == "Energia"
+    assert dados["description"] == tipo.description.como_texto()
+    assert dados["is_active"] is True
+    assert dados["created_at"] == tipo.created_at.isoformat()
+    assert dados["updated_at"] is None
+    assert dados["deleted_at"] is None
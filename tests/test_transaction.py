@@ -0,0 +1,55 @@
+from datetime import timezone
+
+from core.entities import Transaction
+
+
+def test_reconstituir_lote_faz_ida_e_volta_com_como_registro_banco():
+    originais = [
+        Transaction.criar("Salário", "05/09/2025", "1.234,56", 1),
+        Transaction.criar("Aluguel", "10/09/2025", "900,00", 2),
+        Transaction.criar("Salário", "05/09/2025", "1.234,56", 1),
+    ]
+    originais[1].patch(valor_monetario="950,00")
+
+    registros = [t.como_registro_banco() for t in originais]
+    reconstituidas = Transaction.reconstituir_lote(registros)
+
+    assert [t.como_registro_banco() for t in reconstituidas] == registros
+    assert reconstituidas[0].id != reconstituidas[2].id
+    # VOs iguais no mesmo lote são compartilhados
+    assert reconstituidas[0].valor is reconstituidas[2].valor
+    assert reconstituidas[1].updated_at == originais[1].updated_at
+
+
+def test_reconstituir_preserva_identidade_e_auditoria():
+    original = Transaction.criar("Mercado", "03/09/2025", "150,00", 2)
+    original.patch(descricao="Mercado do mês")
+
+    reconstituida = Transaction.reconstituir(
+        identificador=original.id,
+        descricao="Mercado do mês",
+        data_evento=original.data_evento.para_banco(),
+        valor_monetario=original.valor,
+        tipo=original.tipo,
+        criado_em=original.created_at,
+        atualizado_em=original.updated_at,
+    )
+
+    assert reconstituida.como_registro_banco() == original.como_registro_banco()
+    assert not reconstituida.is_deleted
+
+
+def test_criar_gera_identidade_e_auditoria():
+    transacao = Transaction.criar("Café", "01/09/2025", "7,50")
+
+    assert transacao.id.version == 7
+    assert transacao.created_at.tzinfo is timezone.utc
+    assert transacao.updated_at is None
+    assert transacao.deleted_at is None
+    assert transacao.tipo.e_entrada()
+
+
+def test_como_linha_banco_equivale_ao_registro():
+    transacao = Transaction.criar("Internet", "15/09/2025", "99,90", 2)
+
+    assert transacao.como_linha_banco()._asdict() == transacao.como_registro_banco()
@@ -0,0 +1,73 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from core.shared.value_objects import ReferenciaMensal, ValorMonetario
+from core.value_object import MesReferencia, Valor
+
+
+def test_criar_de_centavos_equivale_a_criar_de_bruto():
+    de_centavos = Valor.criar_de_centavos(123456)
+    de_bruto = Valor.criar_de_bruto("R$ 1.234,56")
+
+    assert de_centavos == de_bruto
+    assert hash(de_centavos) == hash(de_bruto)
+    assert de_centavos.valor == Decimal("1234.56")
+    assert de_bruto.to_centavos() == de_centavos.to_centavos() == 123456
+
+    with pytest.raises(ValueError):
+        Valor.criar_de_centavos(-1)
+
+
+def test_incrementar_e_decrementar_com_inteiros_e_decimais():
+    valor = Valor.criar_de_bruto("10,50")
+
+    assert valor.incrementar(2).valor == Decimal("12.50")
+    assert valor.decrementar(10).to_centavos() == 50
+    assert valor.incrementar(Decimal("0.25")).to_centavos() == 1075
+
+    with pytest.raises(ValueError):
+        valor.decrementar(11)
+
+
+@pytest.mark.parametrize(
+    "bruto",
+    ["R$ 1.234,56", "10,5", "-3", "0,005", "1e3", ".5", 42, 1.1, Decimal("2.345")],
+)
+def test_centavos_from_bruto_igual_ao_caminho_decimal(bruto):
+    assert ValorMonetario.centavos_from_bruto(bruto) == ValorMonetario.from_bruto(bruto).to_centavos()
+
+
+def test_centavos_from_bruto_lote_gera_coluna_int64():
+    brutos = ["R$ 1.234,56", "10,5", "R$ 1.234,56", 7, Decimal("0.01")]
+
+    centavos = ValorMonetario.centavos_from_bruto_lote(brutos)
+
+    assert centavos.dtype == np.int64
+    assert centavos.tolist() == [123456, 1050, 123456, 700, 1]
+    assert ValorMonetario.centavos_from_bruto_lote([]).tolist() == []
+
+
+def test_fabricas_com_cache_devolvem_a_mesma_instancia():
+    assert ValorMonetario.from_centavos(987) is ValorMonetario.from_centavos(987)
+    assert ValorMonetario.from_centavos(987).valor == Decimal("9.87")
+
+    referencia = ReferenciaMensal.de_texto("09/2025 (Atual)")
+    assert referencia is ReferenciaMensal.de_texto("09/2025 (Atual)")
+    assert referencia == ReferenciaMensal("09/2025")
+    with pytest.raises(ValueError):
+        ReferenciaMensal.de_texto("13/2025")
+
+
+def test_from_centavos_trunca_para_inteiro_antes_do_cache():
+    assert ValorMonetario.from_centavos(150.7).valor == Decimal("1.50")
+    assert ValorMonetario.from_centavos(150.7) is ValorMonetario.from_centavos(150)
+
+
+def test_mes_referencia_de_texto_usa_a_fabrica_da_subclasse():
+    referencia = MesReferencia.de_texto("09/2025 (Atual)")
+
+    assert type(referencia) is MesReferencia
+    assert referencia is MesReferencia.criar_de_texto("09/2025 (Atual)")
+    assert referencia.referencia == "09/2025"